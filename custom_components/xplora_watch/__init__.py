@@ -14,6 +14,7 @@ from .const import DATA_HASS_CONFIG, DOMAIN
 from .coordinator import XploraDataUpdateCoordinator
 from .helper import create_service_yaml_file, create_www_directory, move_emojis_directory
 from .services import async_setup_services, async_unload_services
+from .views import XploraTrackView
 
 PLATFORMS = [Platform.BINARY_SENSOR, Platform.DEVICE_TRACKER, Platform.NOTIFY, Platform.SENSOR, Platform.SWITCH]
 
@@ -27,6 +28,7 @@ async def async_setup(hass: HomeAssistant, hass_config: ConfigType) -> bool:
     _LOGGER.debug("Set up the Xplora® Watch Version 2 component")
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][DATA_HASS_CONFIG] = hass_config
+    hass.http.register_view(XploraTrackView())
     return True
 
 
@@ -56,7 +58,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
     await async_setup_services(hass, entry.entry_id)
-    watches = await coordinator.controller.setDevices()
+    watches = coordinator.controller.getWatchUserIDs()
 
     await create_www_directory(hass)
     await move_emojis_directory(hass)
@@ -87,7 +89,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     async_unload_services(hass)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: XploraDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        if coordinator.history is not None:
+            await coordinator.history.async_unload()
     return unload_ok
 
 
@@ -7,39 +7,23 @@ from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity, BinarySensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    ATTR_ID,
-    CONF_LATITUDE,
-    CONF_LONGITUDE,
-    CONF_NAME,
-    CONF_RADIUS,
-    STATE_OFF,
-    STATE_ON,
-    EntityCategory,
-)
+from homeassistant.const import ATTR_ID, CONF_NAME, STATE_OFF, STATE_ON, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     ATTR_SERVICE_USER,
-    ATTR_TRACKER_LAT,
-    ATTR_TRACKER_LNG,
     ATTR_WATCH,
     BINARY_SENSOR_CHARGING,
     BINARY_SENSOR_SAFEZONE,
     BINARY_SENSOR_STATE,
-    CONF_HOME_LATITUDE,
-    CONF_HOME_LONGITUDE,
-    CONF_HOME_RADIUS,
     CONF_HOME_SAFEZONE,
     CONF_TYPES,
     CONF_WATCHES,
     DOMAIN,
-    HOME,
 )
-from .coordinator import XploraDataUpdateCoordinator
+from .coordinator import XploraDataUpdateCoordinator, XploraWatchCoordinator
 from .entity import XploraBaseEntity
-from .helper import is_distance_in_radius
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,7 +75,7 @@ async def async_setup_entry(
             if conf_watches is None or conf_tyes is None or wuid not in conf_watches or description.key not in conf_tyes:
                 continue
 
-            entities.append(XploraBinarySensor(config_entry, coordinator, ward, wuid, description))
+            entities.append(XploraBinarySensor(config_entry, coordinator.watch_coordinators[wuid], ward, wuid, description))
 
     async_add_entities(entities)
 
@@ -102,14 +86,14 @@ class XploraBinarySensor(XploraBaseEntity, BinarySensorEntity):
     def __init__(
         self,
         config_entry: ConfigEntry,
-        coordinator: XploraDataUpdateCoordinator,
+        coordinator: XploraWatchCoordinator,
         ward: dict[str, Any],
         wuid: str,
         description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize Binary Sensor."""
         super().__init__(config_entry, description, coordinator, wuid)
-        if self.watch_uid not in self.coordinator.data:
+        if self.coordinator.data is None:
             return
 
         self._attr_name: str = f"{ward.get(CONF_NAME)} {ATTR_WATCH} {description.key} ({coordinator.username})".replace(
@@ -126,39 +110,21 @@ class XploraBinarySensor(XploraBaseEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
+        snapshot = self.coordinator.data
         if self.entity_description.key == BINARY_SENSOR_CHARGING:
-            return self.coordinator.data[self.watch_uid].get("isCharging", None)
+            return snapshot.is_charging
         if self.entity_description.key == BINARY_SENSOR_STATE:
-            return self.coordinator.data[self.watch_uid].get("isOnline", None)
+            return snapshot.is_online
         if self.entity_description.key == BINARY_SENSOR_SAFEZONE:
-            if self._options.get(CONF_HOME_SAFEZONE, STATE_OFF) == STATE_ON:
-                latitude = self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LAT, None)
-                longitude = self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LNG, None)
-                home_state = self.hass.states.get(HOME)
-                if home_state and home_state.attributes:
-                    home_latitude = home_state.attributes[CONF_LATITUDE]
-                    home_longitude = home_state.attributes[CONF_LONGITUDE]
-                    home_raduis = home_state.attributes[CONF_RADIUS]
-                    if is_distance_in_radius(
-                        (
-                            self._options.get(CONF_HOME_LATITUDE, home_latitude),
-                            self._options.get(CONF_HOME_LONGITUDE, home_longitude),
-                        ),
-                        (latitude, longitude),
-                        self._options.get(CONF_HOME_RADIUS, home_raduis),
-                    ):
-                        return False
-                else:
-                    return False
-            return self.coordinator.data[self.watch_uid].get("isSafezone", None)
+            if self._options.get(CONF_HOME_SAFEZONE, STATE_OFF) == STATE_ON and snapshot.in_home_safezone is not False:
+                return False
+            return snapshot.is_safezone
         return False
 
     @property
     def icon(self) -> str | None:
         """Return the icon to use in the frontend, if any."""
-        if self.entity_description.key == BINARY_SENSOR_CHARGING and not self.coordinator.data[self.watch_uid].get(
-            "isCharging", None
-        ):
+        if self.entity_description.key == BINARY_SENSOR_CHARGING and not self.coordinator.data.is_charging:
             return "mdi:battery-unknown"
         if hasattr(self, "_attr_icon"):
             return self._attr_icon
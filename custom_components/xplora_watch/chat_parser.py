@@ -0,0 +1,112 @@
+"""Chat payload parser for Xplora® Watch Version 2.
+
+Produces the same dictionaries as ``ChatsNew.from_dict(payload).to_dict()`` of
+pyxplora_api without building the dataclasses-json models in between.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+_MISSING = object()
+_UNKNOWN = "UNKNOWN__"
+
+
+def _as_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _as_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _as_str(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _as_is(value: Any) -> Any:
+    return value
+
+
+Field = tuple[str, Any, Callable[[Any], Any]]
+
+
+def _normalize(raw: dict[str, Any], fields: tuple[Field, ...]) -> dict[str, Any]:
+    """Keep the known fields of a payload, filling defaults and converting types."""
+    result: dict[str, Any] = {}
+    for name, default, convert in fields:
+        value = raw.get(name, _MISSING)
+        if value is _MISSING:
+            result[name] = default
+        elif value is None:
+            result[name] = None
+        else:
+            result[name] = convert(value)
+    return result
+
+
+_USER_FIELDS: tuple[Field, ...] = (
+    ("id", None, _as_str),
+    ("userId", None, _as_str),
+    ("name", None, _as_str),
+    ("phoneNumber", None, _as_str),
+)
+
+_DATA_FIELDS: tuple[Field, ...] = (
+    ("tm", None, _as_int),
+    ("sender_name", None, _as_str),
+    ("text", None, _as_str),
+    ("Text", None, _as_str),
+    ("battery", None, _as_int),
+    ("poi", None, _as_str),
+    ("city", None, _as_str),
+    ("address", None, _as_str),
+    ("province", None, _as_str),
+    ("locate_type", None, _as_str),
+    ("emoticon_id", _UNKNOWN, _as_is),
+    ("emoji_id", _UNKNOWN, _as_is),
+    ("call_name", None, _as_str),
+    ("call_time", None, _as_int),
+    ("call_type", None, _as_int),
+    ("lat", None, _as_float),
+    ("lng", None, _as_float),
+    ("radius", None, _as_int),
+    ("delete_flag", 0, _as_int),
+)
+
+
+def _as_user(value: Any) -> dict[str, Any] | None:
+    return _normalize(value, _USER_FIELDS) if isinstance(value, dict) else None
+
+
+def _as_data(value: Any) -> dict[str, Any] | None:
+    return _normalize(value, _DATA_FIELDS) if isinstance(value, dict) else None
+
+
+_CHAT_FIELDS: tuple[Field, ...] = (
+    ("id", None, _as_str),
+    ("msgId", None, _as_str),
+    ("readFlag", None, _as_int),
+    ("sender", None, _as_user),
+    ("receiver", None, _as_user),
+    ("data", None, _as_data),
+    ("create", None, _as_int),
+    ("type", _UNKNOWN, _as_is),
+)
+
+
+def parse_chats(res_chats: dict[str, Any] | None) -> dict[str, Any]:
+    """Normalize the chats returned by getWatchChatsRaw."""
+    chats = (res_chats or {}).get("list", _MISSING)
+    if chats is _MISSING:
+        return {"list": []}
+    if chats is None:
+        return {"list": None}
+    return {"list": [_normalize(chat, _CHAT_FIELDS) for chat in chats if isinstance(chat, dict)]}
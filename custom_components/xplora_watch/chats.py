@@ -0,0 +1,137 @@
+"""Incremental chat sync for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+import aiohttp
+from pyxplora_api.exception_classes import Error
+from pyxplora_api.pyxplora_api_async import PyXploraApi
+
+from .chat_parser import parse_chats
+from .const import CHAT_DELTA_LIMIT, CHAT_WINDOW_LIMIT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ChatCursor:
+    """Newest known message and the chat window of one watch."""
+
+    unread: int = -1
+    marker: tuple[str | None, int | None] = (None, None)
+    limit: int = 0
+    show_del_msg: bool = True
+    window: list[dict[str, Any]] = field(default_factory=list)
+
+
+def merge_chats(new: list[dict[str, Any]], window: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
+    """Merge fetched chats into a window, newest first and without duplicates."""
+    merged: dict[str | None, dict[str, Any]] = {chat.get("msgId"): chat for chat in window}
+    merged.update((chat.get("msgId"), chat) for chat in new)
+    chats = sorted(merged.values(), key=lambda chat: chat.get("create") or 0, reverse=True)
+    return chats[:limit]
+
+
+class ChatSync:
+    """Keep the newest chats of each watch in memory and only fetch what changed.
+
+    Each sync asks for the unread counter and the newest message. The chat list is
+    only requested when one of them differs from the last sync, and then only the
+    messages newer than the last known one. Once a fetch covers the whole window,
+    it replaces the window, so deleted or hidden messages drop out of it. The
+    counter is read again after a fetch, since fetching marks the messages read.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the chat sync."""
+        self._cursors: dict[str, ChatCursor] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self.fetch_count = 0
+        self.skip_count = 0
+
+    def chats(self, wuid: str) -> dict[str, Any]:
+        """Return the chat window of a watch."""
+        cursor = self._cursors.get(wuid)
+        return {"list": list(cursor.window) if cursor else []}
+
+    async def async_invalidate(self, wuid: str) -> None:
+        """Forget the chats of a watch, the next sync fetches the whole window again."""
+        async with self._locks.setdefault(wuid, asyncio.Lock()):
+            self._cursors.pop(wuid, None)
+
+    async def _async_latest_marker(self, controller: PyXploraApi, wuid: str) -> tuple[str | None, int | None] | None:
+        """Return msgId and create time of the newest message without marking it read, None if the request failed."""
+        try:
+            res: dict[str, Any] = await controller._gql_handler.chats_a(wuid, 0, 1, "")  # noqa: SLF001
+        except (Error, aiohttp.ClientError, TimeoutError) as error:
+            _LOGGER.debug("Unable to load the newest chat of %s: %s", wuid[25:], error)
+            return None
+        if not isinstance(res, dict) or "chatsNew" not in res:
+            return None
+        latest: list[dict[str, Any]] = (res["chatsNew"] or {}).get("list") or []
+        if not latest:
+            return None, None
+        return latest[0].get("msgId"), latest[0].get("create")
+
+    async def _async_fetch(self, controller: PyXploraApi, wuid: str, limit: int, show_del_msg: bool) -> list[dict[str, Any]]:
+        res_chats = await controller.getWatchChatsRaw(wuid, limit=limit, show_del_msg=show_del_msg)
+        self.fetch_count += 1
+        return parse_chats(res_chats).get("list") or []
+
+    async def async_sync(
+        self, controller: PyXploraApi, wuid: str, limit: int, show_del_msg: bool
+    ) -> tuple[int, dict[str, Any] | None]:
+        """Return the unread counter and the chats of a watch, chats are None if nothing changed."""
+        async with self._locks.setdefault(wuid, asyncio.Lock()):
+            return await self._async_sync(controller, wuid, limit, show_del_msg)
+
+    async def _async_sync(
+        self, controller: PyXploraApi, wuid: str, limit: int, show_del_msg: bool
+    ) -> tuple[int, dict[str, Any] | None]:
+        unread, marker = await asyncio.gather(
+            controller.getWatchUnReadChatMsgCount(wuid),
+            self._async_latest_marker(controller, wuid),
+        )
+        cursor = self._cursors.get(wuid)
+        if cursor is not None and (cursor.limit, cursor.show_del_msg) != (limit, show_del_msg):
+            cursor = None
+        if cursor is not None:
+            # A failed request keeps what the last sync saw instead of forcing a fetch.
+            marker = cursor.marker if marker is None else marker
+            unread = cursor.unread if unread == -1 else unread
+        if cursor is not None and cursor.unread == unread and cursor.marker == marker:
+            self.skip_count += 1
+            return unread, None
+
+        window_limit = limit if limit > 0 else CHAT_WINDOW_LIMIT
+        window: list[dict[str, Any]] = []
+        if cursor is None or not cursor.window:
+            new = await self._async_fetch(controller, wuid, limit, show_del_msg)
+        else:
+            known = {chat.get("msgId") for chat in cursor.window}
+            size = CHAT_DELTA_LIMIT
+            while True:
+                size = min(size, window_limit)
+                new = await self._async_fetch(controller, wuid, size, show_del_msg)
+                if size >= window_limit or len(new) < size or any(chat.get("msgId") in known for chat in new):
+                    break
+                size *= 2
+            # A fetch of the whole window is complete, messages missing from it were deleted or hidden.
+            if size < window_limit:
+                window = cursor.window
+            _LOGGER.debug("Fetched %s chats of %s since %s", len(new), wuid[25:], cursor.marker[0])
+
+        # Fetching marks the messages read, the next sync compares against the counter after the fetch.
+        unread_after = await controller.getWatchUnReadChatMsgCount(wuid)
+        self._cursors[wuid] = ChatCursor(
+            unread=unread if unread_after == -1 else unread_after,
+            marker=marker or (None, None),
+            limit=limit,
+            show_del_msg=show_del_msg,
+            window=merge_chats(new, window, window_limit),
+        )
+        return self._cursors[wuid].unread, self.chats(wuid)
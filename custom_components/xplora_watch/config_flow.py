@@ -44,12 +44,23 @@ from homeassistant.helpers.selector import (
 )
 
 from .const import (
+    CONF_CONFIG_INTERVAL,
+    CONF_GEOCODE_CACHE_TTL,
+    CONF_GEOCODE_DISTANCE,
+    CONF_GEOCODE_HEDGE,
+    CONF_GEOCODE_PRECISION,
+    CONF_HISTORY_SIZE,
     CONF_HOME_LATITUDE,
     CONF_HOME_LONGITUDE,
     CONF_HOME_RADIUS,
     CONF_HOME_SAFEZONE,
     CONF_MAPS,
+    CONF_MAX_CONCURRENT,
+    CONF_MAX_SCAN_INTERVAL,
     CONF_MESSAGE,
+    CONF_MESSAGE_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_OFFLINE_DATASET,
     CONF_OPENCAGE_APIKEY,
     CONF_PHONENUMBER,
     CONF_REMOVE_MESSAGE,
@@ -58,7 +69,17 @@ from .const import (
     CONF_TYPES,
     CONF_USERLANG,
     CONF_WATCHES,
+    DEFAULT_CONFIG_INTERVAL,
+    DEFAULT_GEOCODE_CACHE_TTL,
+    DEFAULT_GEOCODE_DISTANCE,
+    DEFAULT_GEOCODE_PRECISION,
+    DEFAULT_HISTORY_SIZE,
     DEFAULT_LANGUAGE,
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MESSAGE_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_OFFLINE_DATASET,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     HOME,
@@ -259,6 +280,44 @@ class XploraOptionsFlowHandler(OptionsFlowWithConfigEntry):
                 vol.Optional(CONF_OPENCAGE_APIKEY, default=_options.get(CONF_OPENCAGE_APIKEY, "")): TextSelector(
                     TextSelectorConfig(type=TextSelectorType.TEXT)
                 ),
+                vol.Optional(
+                    CONF_OFFLINE_DATASET, default=_options.get(CONF_OFFLINE_DATASET, DEFAULT_OFFLINE_DATASET)
+                ): TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
+                vol.Required(
+                    CONF_GEOCODE_DISTANCE, default=_options.get(CONF_GEOCODE_DISTANCE, DEFAULT_GEOCODE_DISTANCE)
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=1000,
+                        mode=NumberSelectorMode.SLIDER,
+                    ),
+                ),
+                vol.Required(CONF_GEOCODE_HEDGE, default=_options.get(CONF_GEOCODE_HEDGE, False)): BooleanSelector(),
+                vol.Required(
+                    CONF_GEOCODE_PRECISION, default=_options.get(CONF_GEOCODE_PRECISION, DEFAULT_GEOCODE_PRECISION)
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=5,
+                        max=9,
+                        mode=NumberSelectorMode.SLIDER,
+                    ),
+                ),
+                vol.Required(
+                    CONF_GEOCODE_CACHE_TTL, default=_options.get(CONF_GEOCODE_CACHE_TTL, DEFAULT_GEOCODE_CACHE_TTL)
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=365,
+                        mode=NumberSelectorMode.SLIDER,
+                    ),
+                ),
+                vol.Required(CONF_HISTORY_SIZE, default=_options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE)): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=10000,
+                        mode=NumberSelectorMode.SLIDER,
+                    ),
+                ),
                 vol.Required(
                     CONF_SCAN_INTERVAL, default=_options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
                 ): NumberSelector(
@@ -268,6 +327,51 @@ class XploraOptionsFlowHandler(OptionsFlowWithConfigEntry):
                         mode=NumberSelectorMode.SLIDER,
                     ),
                 ),
+                vol.Required(
+                    CONF_MIN_SCAN_INTERVAL, default=_options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=10,
+                        max=9999,
+                        mode=NumberSelectorMode.SLIDER,
+                    ),
+                ),
+                vol.Required(
+                    CONF_MAX_SCAN_INTERVAL, default=_options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=10,
+                        max=9999,
+                        mode=NumberSelectorMode.SLIDER,
+                    ),
+                ),
+                vol.Required(
+                    CONF_MESSAGE_INTERVAL, default=_options.get(CONF_MESSAGE_INTERVAL, DEFAULT_MESSAGE_INTERVAL)
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=9999,
+                        mode=NumberSelectorMode.SLIDER,
+                    ),
+                ),
+                vol.Required(
+                    CONF_CONFIG_INTERVAL, default=_options.get(CONF_CONFIG_INTERVAL, DEFAULT_CONFIG_INTERVAL)
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=86400,
+                        mode=NumberSelectorMode.SLIDER,
+                    ),
+                ),
+                vol.Required(
+                    CONF_MAX_CONCURRENT, default=_options.get(CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT)
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=1,
+                        max=10,
+                        mode=NumberSelectorMode.SLIDER,
+                    ),
+                ),
                 vol.Required(CONF_HOME_SAFEZONE, default=_options.get(CONF_HOME_SAFEZONE, STATE_OFF)): SelectSelector(
                     SelectSelectorConfig(
                         options=[
@@ -318,7 +422,7 @@ class XploraOptionsFlowHandler(OptionsFlowWithConfigEntry):
         """Handle options flow."""
         errors: dict[str, str] = {}
         controller = await sign_in(hass=self.hass, data=self.config_entry.data)
-        watches = await controller.setDevices()
+        watches = controller.getWatchUserIDs()
         _options = self.config_entry.options
 
         schema = OrderedDict()
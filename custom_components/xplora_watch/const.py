@@ -39,12 +39,23 @@ ATTR_TRACKER_RAD: Final = "rad"
 
 ATTR_WATCH: Final = "watch"
 
+CONF_CONFIG_INTERVAL: Final = "config_interval"
+CONF_GEOCODE_DISTANCE: Final = "geocode_distance"
+CONF_GEOCODE_HEDGE: Final = "geocode_hedge"
+CONF_GEOCODE_CACHE_TTL: Final = "geocode_cache_ttl"
+CONF_GEOCODE_PRECISION: Final = "geocode_precision"
+CONF_HISTORY_SIZE: Final = "history_size"
 CONF_HOME_SAFEZONE: Final = "home_is_safezone"
 CONF_HOME_LATITUDE: Final = "home_latitude"
 CONF_HOME_LONGITUDE: Final = "home_longitude"
 CONF_HOME_RADIUS: Final = "home_radius"
 CONF_MAPS: Final = "maps"
+CONF_MAX_CONCURRENT: Final = "max_concurrent"
+CONF_MAX_SCAN_INTERVAL: Final = "max_scan_interval"
 CONF_MESSAGE: Final = "message"
+CONF_MESSAGE_INTERVAL: Final = "message_interval"
+CONF_MIN_SCAN_INTERVAL: Final = "min_scan_interval"
+CONF_OFFLINE_DATASET: Final = "offline_dataset"
 CONF_OPENCAGE_APIKEY: Final = "opencage_apikey"
 CONF_PHONENUMBER: Final = "phonenumber"
 CONF_REMOVE_MESSAGE: Final = "remove_message"
@@ -56,7 +67,10 @@ CONF_WATCHES: Final = "watches"
 
 SENSOR_BATTERY: Final = "battery"
 SENSOR_DISTANCE: Final = "distance"
+SENSOR_DISTANCE_TODAY: Final = "distance_today"
+SENSOR_LAST_MOVED: Final = "last_moved"
 SENSOR_MESSAGE: Final = "message"
+SENSOR_SPEED: Final = "speed"
 SENSOR_STEP_DAY: Final = "step_day"
 SENSOR_XCOIN: Final = "xcoin"
 
@@ -73,13 +87,76 @@ DEVICE_TRACKER_SAFZONES: Final = "watch_safezone"
 DEVICE_TRACKER_WATCH: Final = "dt_watch"
 
 DEFAULT_SCAN_INTERVAL: Final = 3 * 60
+DEFAULT_MAX_CONCURRENT: Final = 3
+DEFAULT_OFFLINE_DATASET: Final = "cities1000.txt"
+DEFAULT_MIN_SCAN_INTERVAL: Final = 60
+DEFAULT_MAX_SCAN_INTERVAL: Final = 30 * 60
+DEFAULT_MESSAGE_INTERVAL: Final = 5 * 60
+DEFAULT_CONFIG_INTERVAL: Final = 6 * 60 * 60
+DEFAULT_GEOCODE_DISTANCE: Final = 50
+DEFAULT_GEOCODE_PRECISION: Final = 7
+DEFAULT_GEOCODE_CACHE_TTL: Final = 30
+DEFAULT_HISTORY_SIZE: Final = 1000
+DEFAULT_TOKEN_LIFETIME: Final = 4 * 60 * 60
+TOKEN_REFRESH_MARGIN: Final = 10 * 60
+
+LOW_BATTERY_LEVEL: Final = 20
+MOVEMENT_THRESHOLD: Final = 50
+
+CHAT_DELTA_LIMIT: Final = 5
+CHAT_WINDOW_LIMIT: Final = 100
+
+GEOCODE_CACHE_SIZE: Final = 1000
+GEOCODE_CACHE_SAVE_DELAY: Final = 30
+HISTORY_SAVE_DELAY: Final = 60
+TRACK_CHUNK_SIZE: Final = 500
+TRACK_ADDRESS_LIMIT: Final = 200
+MEDIA_DECODE_CHUNK_SIZE: Final = 4 * 16384  # base64 characters, a multiple of 4
+TRANSCODE_WORKERS: Final = 4
+TRANSCODE_TIMEOUT: Final = 60
+TRANSCODE_LATENCY_SAMPLES: Final = 50
+TRANSCODE_JOB_HISTORY: Final = 200
+STORAGE_VERSION: Final = 1
+
+TIER_CONFIG: Final = "config"
+TIER_MESSAGES: Final = "messages"
 
 HOME: Final = "zone.home"
 TRACKER_UPDATE_STR: Final = f"{DOMAIN}_tracker_update"
 
+DATA_GEOCODE_QUEUES: Final = "geocode_queues"
 DATA_HASS_CONFIG: Final = "hass_config"
+DATA_OFFLINE_GEOCODERS: Final = "offline_geocoders"
+DATA_TRANSCODER: Final = "transcoder"
 
-MAPS: Final[list[str]] = ["openstreetmap.org (free)", "opencagedata.com (with Licence)"]
+MAPS: Final[list[str]] = [
+    "openstreetmap.org (free)",
+    "opencagedata.com (with Licence)",
+    "offline (GeoNames dataset)",
+]
+MAPBOX: Final = "mapbox.com"
+
+# Minimum seconds between two requests to a map provider
+GEOCODE_RATE_LIMITS: Final[dict[str, float]] = {MAPS[0]: 1.0, MAPS[1]: 1.0, MAPBOX: 0.1}
+GEOCODE_RETRY_AFTER: Final = 60
+GEOCODE_DEADLINE: Final = 10
+GEOCODE_REQUEST_TIMEOUT: Final = 5
+GEOCODE_FAILURE_THRESHOLD: Final = 3
+GEOCODE_COOL_DOWN: Final = 300
+GEOCODE_TIMEOUTS: Final[dict[str, float]] = {MAPS[0]: 10, MAPS[1]: GEOCODE_DEADLINE, MAPBOX: 5}
+GEOCODE_LATENCY_SAMPLES: Final = 50
+GEOCODE_HEDGE_MIN_SAMPLES: Final = 10
+GEOCODE_BATCH_CONCURRENCY: Final = 4
+
+OFFLINE_CELL_SIZE: Final = 0.1
+ZONE_CELL_SIZE: Final = 0.01
+SAFE_ZONE_PREFIX: Final = "safezone_"
+GEOFENCE_HOME_SAFEZONE: Final = "home_safezone"
+GEOFENCE_HYSTERESIS: Final = 30
+GEOFENCE_MAX_ACCURACY: Final = 1000
+EVENT_XPLORA_GEOFENCE: Final = "xplora_watch_geofence"
+OFFLINE_LICENCE: Final = "Data © GeoNames.org, CC BY 4.0"
+OFFLINE_MAX_DISTANCE: Final = 10000
 
 ##########################
 # Section: Multilanguage #
@@ -138,7 +215,10 @@ SENSORS: Final[dict[str, dict[str, str]]] = {
         DEVICE_TRACKER_WATCH: "Watch tracking",
         SENSOR_BATTERY: "Battery state",
         SENSOR_DISTANCE: "Distance",
+        SENSOR_DISTANCE_TODAY: "Distance travelled today",
+        SENSOR_LAST_MOVED: "Last moved",
         SENSOR_MESSAGE: "Read Message(s) from Account",
+        SENSOR_SPEED: "Speed",
         SENSOR_STEP_DAY: "Steps per Day",
         SENSOR_XCOIN: "XCoins",
         SWITCH_ALARMS: "Alarms",
@@ -152,7 +232,10 @@ SENSORS: Final[dict[str, dict[str, str]]] = {
         DEVICE_TRACKER_WATCH: "Watch Tracking",
         SENSOR_BATTERY: "Batterie-Status",
         SENSOR_DISTANCE: "Distanz",
+        SENSOR_DISTANCE_TODAY: "Heute zurückgelegte Strecke",
+        SENSOR_LAST_MOVED: "Zuletzt bewegt",
         SENSOR_MESSAGE: "Nachricht(en) vom Account",
+        SENSOR_SPEED: "Geschwindigkeit",
         SENSOR_STEP_DAY: "Schritte pro Tag",
         SENSOR_XCOIN: "XCoins",
         SWITCH_ALARMS: "Wecker",
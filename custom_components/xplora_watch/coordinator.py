@@ -2,23 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import replace
 from datetime import datetime, timedelta
+from functools import partial
 import logging
+import time
 from typing import Any
 
 import aiohttp
+from geopy import distance
 from pyxplora_api.const import DEFAULT_TIMEOUT
-from pyxplora_api.model import ChatsNew
 from pyxplora_api.pyxplora_api_async import PyXploraApi
 from pyxplora_api.status import LocationType, WatchOnlineStatus
 
-from homeassistant.components.device_tracker.const import ATTR_BATTERY, ATTR_LOCATION_NAME
+from homeassistant.components.zone import DOMAIN as ZONE_DOMAIN
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_COUNTRY_CODE, CONF_EMAIL, CONF_LANGUAGE, CONF_PASSWORD, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_EMAIL,
+    CONF_LANGUAGE,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    CONF_RADIUS,
+    CONF_SCAN_INTERVAL,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import aiohttp_client
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
+from .chats import ChatSync
 from .const import (
     API_KEY_MAPBOX,
     ATTR_TRACKER_ADDR,
@@ -28,295 +44,727 @@ from .const import (
     ATTR_TRACKER_LNG,
     ATTR_TRACKER_POI,
     ATTR_TRACKER_RAD,
+    CONF_CONFIG_INTERVAL,
+    CONF_GEOCODE_CACHE_TTL,
+    CONF_GEOCODE_DISTANCE,
+    CONF_GEOCODE_HEDGE,
+    CONF_GEOCODE_PRECISION,
+    CONF_HISTORY_SIZE,
+    CONF_HOME_LATITUDE,
+    CONF_HOME_LONGITUDE,
+    CONF_HOME_RADIUS,
+    CONF_HOME_SAFEZONE,
     CONF_MAPS,
+    CONF_MAX_CONCURRENT,
+    CONF_MAX_SCAN_INTERVAL,
     CONF_MESSAGE,
+    CONF_MESSAGE_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_OFFLINE_DATASET,
     CONF_OPENCAGE_APIKEY,
     CONF_PHONENUMBER,
     CONF_REMOVE_MESSAGE,
-    CONF_TIMEZONE,
-    CONF_USERLANG,
     CONF_WATCHES,
+    DEFAULT_CONFIG_INTERVAL,
+    DEFAULT_GEOCODE_CACHE_TTL,
+    DEFAULT_GEOCODE_DISTANCE,
+    DEFAULT_GEOCODE_PRECISION,
+    DEFAULT_HISTORY_SIZE,
     DEFAULT_LANGUAGE,
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MESSAGE_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_OFFLINE_DATASET,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    EVENT_XPLORA_GEOFENCE,
+    GEOCODE_BATCH_CONCURRENCY,
+    GEOCODE_DEADLINE,
+    GEOCODE_REQUEST_TIMEOUT,
+    GEOCODE_RETRY_AFTER,
+    GEOCODE_TIMEOUTS,
+    GEOFENCE_HOME_SAFEZONE,
+    HOME,
+    MAPBOX,
     MAPS,
-    SENSOR_MESSAGE,
-    SENSOR_XCOIN,
+    OFFLINE_LICENCE,
+    SAFE_ZONE_PREFIX,
+    TIER_CONFIG,
+    TIER_MESSAGES,
     URL_MAPBOX,
     URL_OPENSTREETMAP,
 )
-from .geocoder import OpenCageGeocodeUA
+from .distances import DistanceEngine
+from .geocode_cache import GeocodeCache
+from .geocode_chain import GeocodeChain, GeocodeProvider
+from .geocode_queue import GeocodeSkippedError, get_geocode_queue
+from .geocoder import OpenCageGeocodeError, OpenCageGeocodeUA, RateLimitExceededError
+from .geofence import Geofence
+from .location_history import LocationHistoryStore
+from .models import WatchSnapshot
+from .offline_geocoder import OfflineGeocoder, async_get_offline_geocoder, haversine_meter
+from .scheduler import AdaptivePollScheduler
+from .token_manager import XploraTokenManager
+from .zone_index import Zone, ZoneIndex, safe_zone_to_zone, state_to_zone
 
 _LOGGER = logging.getLogger(__name__)
 
+_OPENCAGE_PARAMS: dict[str, int] = {"no_annotations": 1, "pretty": 1, "no_record": 1, "no_dedupe": 1, "limit": 1, "abbrv": 1}
+
+
+class XploraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, WatchSnapshot]]):
+    """Create XploraDataUpdateCoordinator that owns the account session and its watch coordinators."""
 
-class XploraDataUpdateCoordinator(DataUpdateCoordinator):
-    """Create XploraDataUpdateCoordinator that manages data updates."""
-
-    location_name: str | None = None
-    licence: str | None = None
-    controller: PyXploraApi = None
-    lat: float | None = None
-    lng: float | None = None
-    poi: str | None = None
-    location_accuracy: int = -1
-    locate_type: str = LocationType.UNKNOWN.value
-    last_track_time: str | None = None
-    unread_msg: int = -1
-    battery: int = -1
-    is_charging: bool = False
-    is_safezone: bool = False
-    is_online: bool = False
-    device: dict[str, Any] = {}
     username: str
     user_id: str
     is_admin: dict[str, bool] = {}
-    alarm: list = []
-    silent: list = []
-    imei: str = ""
-    watch_id: str | None = None
-    os_version: str = "n/a"
-    model: str = "GPS-Watch"
-    entity_picture: str = ""
-    _step_day: dict
-    _xcoin: int
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize Xplora® data updater."""
         self._entry: ConfigEntry = entry
+        self.token_manager = XploraTokenManager(hass, entry)
         self._opencage_apikey = entry.options.get(CONF_OPENCAGE_APIKEY, "")
         self._maps = entry.options.get(CONF_MAPS, MAPS[0])
+        self._semaphore = asyncio.Semaphore(max(int(entry.options.get(CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT)), 1))
+        self.watch_coordinators: dict[str, XploraWatchCoordinator] = {}
+        self._tier_intervals: dict[str, int] = {
+            TIER_MESSAGES: int(entry.options.get(CONF_MESSAGE_INTERVAL, DEFAULT_MESSAGE_INTERVAL)),
+            TIER_CONFIG: int(entry.options.get(CONF_CONFIG_INTERVAL, DEFAULT_CONFIG_INTERVAL)),
+        }
+        self._tier_fetched: dict[str, dict[str, float]] = {}
+        self.chat_sync = ChatSync()
+        self.geocode_cache = GeocodeCache(
+            hass,
+            f"{DOMAIN}.{entry.entry_id}.geocode",
+            int(entry.options.get(CONF_GEOCODE_PRECISION, DEFAULT_GEOCODE_PRECISION)),
+            int(entry.options.get(CONF_GEOCODE_CACHE_TTL, DEFAULT_GEOCODE_CACHE_TTL)) * 24 * 60 * 60,
+        )
+        self._geocode_distance = int(entry.options.get(CONF_GEOCODE_DISTANCE, DEFAULT_GEOCODE_DISTANCE))
+        self._licences: dict[str, str] = {}
+        self.geocode_chain = GeocodeChain(
+            [
+                GeocodeProvider(
+                    self._maps,
+                    self.opencagedata if self._maps == MAPS[1] else self.openstreetmap,
+                    GEOCODE_TIMEOUTS.get(self._maps, GEOCODE_DEADLINE),
+                    get_geocode_queue(hass, self._maps),
+                ),
+                GeocodeProvider(MAPBOX, self.mapbox, GEOCODE_TIMEOUTS[MAPBOX]),
+            ],
+            hedge=bool(entry.options.get(CONF_GEOCODE_HEDGE, False)),
+        )
+        self.offline_geocoder: OfflineGeocoder | None = None
+        self._zone_sets: dict[str, tuple[tuple[Any, ...], ZoneIndex, DistanceEngine]] = {}
+        self.zone_hit_count = 0
+        self._geofences: dict[str, Geofence] = {}
+        self.history: LocationHistoryStore | None = None
+        if history_size := int(entry.options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE)):
+            self.history = LocationHistoryStore(hass, f"{DOMAIN}.{entry.entry_id}.history", history_size)
+        self._geocoded_fix: dict[str, tuple[float, float, float]] = {}
+        self.geocode_count = 0
+        self.geocode_skip_count = 0
+        self._in_flight: dict[str, asyncio.Task[dict[str, WatchSnapshot]]] = {}
+        self.coalesced_count = 0
         name = f"{DOMAIN}-"
         if CONF_PHONENUMBER in entry.data:
             name += entry.data[CONF_PHONENUMBER][5:]
         elif CONF_EMAIL in entry.data:
             name += entry.data[CONF_EMAIL]
 
+        self.scheduler: AdaptivePollScheduler | None = None
         _scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         if _scan_interval == 0 or _scan_interval is None:
             _update_interval = None
             _LOGGER.debug("Update interval disable")
         else:
             _update_interval = timedelta(seconds=_scan_interval)
+            self.scheduler = AdaptivePollScheduler(
+                _scan_interval,
+                entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+                entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+            )
+        self.watch_update_interval = _update_interval
+        # Polling is scheduled by the watch coordinators, this one only serves full refreshes.
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}-{entry.data[CONF_PHONENUMBER][5:] if CONF_EMAIL not in entry.data else ''}",
             update_method=self.async_update_xplora_data,
-            update_interval=_update_interval,
+            update_interval=None,
         )
 
-    async def set_controller(self, session) -> None:
-        """Set the controller to use."""
-        data = self._entry.data
-        options = self._entry.options
-        self.controller: PyXploraApi = PyXploraApi(
-            countrycode=data.get(CONF_COUNTRY_CODE),
-            phoneNumber=data.get(CONF_PHONENUMBER),
-            password=data[CONF_PASSWORD],
-            userLang=data[CONF_USERLANG],
-            timeZone=data[CONF_TIMEZONE],
-            wuid=options.get(CONF_WATCHES),
-            email=data.get(CONF_EMAIL),
-            session=session,
-        )
+    @property
+    def controller(self) -> PyXploraApi:
+        """Return the long-lived controller of this config entry."""
+        return self.token_manager.controller
 
     async def init(self, session=None) -> None:
         """Init Coordinator."""
-        await self.set_controller(session)
-        await self.controller.init(
-            forceLogin=True
-        )  # key=self.controller._gql_handler.getApiKey(), sec=self.controller._gql_handler.getSecret()
+        await self.token_manager.async_login(session)
+        await self.geocode_cache.async_load()
+        if self.history is not None:
+            await self.history.async_load()
+        if self._maps == MAPS[2]:
+            self.offline_geocoder = await async_get_offline_geocoder(
+                self.hass, self._entry.options.get(CONF_OFFLINE_DATASET, DEFAULT_OFFLINE_DATASET)
+            )
 
         self.username = self.controller.getUserName()
         self.user_id = self.controller.getUserID()
         new_name = self.user_id + self._entry.entry_id
         for watch in self.controller.getWatchUserIDs():
-            _is_admin = await self.controller.isAdmin(watch)
             if new_name in self.is_admin:
                 continue
-            self.is_admin.update({new_name: _is_admin})
+            self.is_admin.update({new_name: await self.controller.isAdmin(watch)})
+
+        for wuid in self._entry.options.get(CONF_WATCHES) or self.controller.getWatchUserIDs():
+            if wuid not in self.watch_coordinators:
+                self.watch_coordinators[wuid] = XploraWatchCoordinator(self.hass, self, wuid)
 
-    async def async_update_xplora_data(self, targets: list[str] | None = None, new_data: dict | None = None):
-        """Fetch data from Xplora."""
-        # Initialize the watch entry data
+    async def async_update_xplora_data(
+        self, targets: list[str] | None = None, new_data: dict[str, WatchSnapshot] | None = None
+    ) -> dict[str, WatchSnapshot] | None:
+        """Fetch data from Xplora and update only the coordinators of the affected watches."""
         if new_data:
             _LOGGER.debug("new data from Message Service")
-            if self.data:
-                self.data.update(new_data)
-            else:
-                self.data = new_data
-            self.async_set_updated_data(self.data)
+            self.async_publish(new_data)
             return None
-        watch_entry = {}
-        if self.data:
-            watch_entry.update(self.data)
 
-        await self.init(aiohttp_client.async_get_clientsession(self.hass))
+        wuids = targets or self._entry.options.get(CONF_WATCHES) or self.controller.getWatchUserIDs()
+        self.async_publish(await self.async_fetch_watches(wuids))
+        return self.data
 
-        # Get the list of watch UUIDs
-        if targets:
-            wuids = await self.controller.setDevices(targets)
-        else:
-            wuids = self._entry.options.get(CONF_WATCHES, await self.controller.setDevices())
+    @callback
+    def async_publish(self, snapshots: dict[str, WatchSnapshot]) -> None:
+        """Hand new snapshots to the coordinators of their watches."""
+        if self.data is None:
+            self.data = {}
+        self.data.update(snapshots)
+        for wuid, snapshot in snapshots.items():
+            if (watch_coordinator := self.watch_coordinators.get(wuid)) is not None:
+                watch_coordinator.async_set_updated_data(snapshot)
+
+    async def async_fetch_watches(self, wuids: list[str]) -> dict[str, WatchSnapshot]:
+        """Fetch the given watches without notifying any listeners.
+
+        Watches that are already being fetched join the running fetch instead of
+        starting a second one, only the remaining watches are requested.
+        """
+        fetches = {wuid: self._in_flight[wuid] for wuid in wuids if wuid in self._in_flight}
+        if fetches:
+            self.coalesced_count += len(fetches)
+            _LOGGER.debug("Join running fetch of %s", [wuid[25:] for wuid in fetches])
+        if missing := [wuid for wuid in wuids if wuid not in fetches]:
+            task = self.hass.async_create_task(self._async_fetch_watches(missing), f"{self.name} fetch")
+
+            def _done(_: asyncio.Task) -> None:
+                for wuid in missing:
+                    if self._in_flight.get(wuid) is task:
+                        del self._in_flight[wuid]
+
+            task.add_done_callback(_done)
+            for wuid in missing:
+                self._in_flight[wuid] = fetches[wuid] = task
+
+        snapshots: dict[str, WatchSnapshot] = {}
+        for task in set(fetches.values()):
+            snapshots.update(await asyncio.shield(task))
+        return {wuid: snapshots[wuid] for wuid in wuids if wuid in snapshots}
+
+    async def _async_fetch_watches(self, wuids: list[str]) -> dict[str, WatchSnapshot]:
+        await self.token_manager.async_ensure_token()
+        # XCoins and icons are part of the account payload, reload it with the config tier.
+        await self.token_manager.async_refresh_user(self._tier_intervals[TIER_CONFIG])
 
         # Get the message limit and remove message option
         message_limit = self._entry.options.get(CONF_MESSAGE, 10)
         message_limit = message_limit if isinstance(message_limit, int) else 10
         remove_message = self._entry.options.get(CONF_REMOVE_MESSAGE, False)
 
-        # Loop through the list of watches and fetch data
-        watch_entry.update(await self.data_loop(wuids, message_limit, remove_message))
-        if not self.data:
-            self.data = watch_entry
-        else:
-            self.data.update(watch_entry)
-        self.async_set_updated_data(self.data)
-        return self.data
+        snapshots = await self.data_loop(wuids, message_limit, remove_message)
+        if self.data is None:
+            self.data = {}
+        self.data.update(snapshots)
+        return snapshots
 
-    async def data_loop(self, wuids: list[str], message_limit, remove_message):
+    async def data_loop(self, wuids: list[str], message_limit, remove_message) -> dict[str, WatchSnapshot]:
         """Fetch and parse Xplora data."""
-        data = {}
-        for wuid in wuids:
-            _LOGGER.debug("Fetch data from Xplora: %s", wuid[25:])
-            self.device = self.controller.getDevice(wuid=wuid)
-            res_chats = await self.controller.getWatchChatsRaw(wuid, limit=message_limit, show_del_msg=remove_message)
-            chats = ChatsNew.from_dict(res_chats).to_dict()
-            watch_location = await self.controller.loadWatchLocation(wuid)
-
-            # Update the watch data
-            self.unread_msg = await self.controller.getWatchUnReadChatMsgCount(wuid)
-            self.battery = self.device.get("watch_battery", -1)
-            self.is_charging = self.device.get("watch_charging", False)
-            self.get_location(watch_location)
-
-            self.is_safezone = False if self.device.get("isInSafeZone", False) else True
-
-            self.is_online = (
-                True
-                if self.device.get("getWatchOnlineStatus", WatchOnlineStatus.UNKNOWN.value) == WatchOnlineStatus.ONLINE.value
-                else False
+
+        async def fetch(wuid: str) -> WatchSnapshot:
+            async with self._semaphore:
+                return await self.get_watch_data(wuid, message_limit, remove_message)
+
+        snapshots = await asyncio.gather(*(fetch(wuid) for wuid in wuids))
+        return {snapshot.watch_id: snapshot for snapshot in snapshots}
+
+    def _tier_due(self, wuid: str, tier: str) -> bool:
+        """Return True if the given data tier of a watch is due."""
+        last = self._tier_fetched.get(wuid, {}).get(tier)
+        return last is None or time.monotonic() - last >= self._tier_intervals[tier]
+
+    async def get_watch_data(self, wuid: str, message_limit, remove_message) -> WatchSnapshot:
+        """Fetch the due data tiers of a single watch and merge them into its last snapshot."""
+        _LOGGER.debug("Fetch data from Xplora: %s", wuid[25:])
+        previous: WatchSnapshot | None = self.data.get(wuid) if self.data else None
+        start = time.monotonic()
+        due = [tier for tier in (TIER_MESSAGES, TIER_CONFIG) if previous is None or self._tier_due(wuid, tier)]
+        tiers = [self.get_location_data(wuid)]
+        if TIER_MESSAGES in due:
+            tiers.append(self.get_message_data(wuid, message_limit, remove_message))
+        if TIER_CONFIG in due:
+            tiers.append(self.get_config_data(wuid))
+
+        fields: dict[str, Any] = {}
+        for result in await asyncio.gather(*tiers):
+            fields.update(result)
+        # Only a fetch that made it into the snapshot restarts the timer, a failed one is retried next poll.
+        self._tier_fetched.setdefault(wuid, {}).update(dict.fromkeys(due, start))
+        snapshot = WatchSnapshot(watch_id=wuid, **fields) if previous is None else replace(previous, **fields)
+        snapshot = replace(snapshot, **self.get_distances(snapshot), **self.get_history(snapshot))
+        return replace(snapshot, **self.get_geofence(snapshot))
+
+    async def get_location_data(self, wuid: str) -> dict[str, Any]:
+        """Fetch location, battery, online state and steps of a watch."""
+        watch_location, online_status, user_steps = await asyncio.gather(
+            self.controller.loadWatchLocation(wuid),
+            self.controller.getWatchOnlineStatus(wuid),
+            self.controller.getWatchUserSteps(wuid, date=int(dt_util.start_of_local_day().timestamp())),
+        )
+
+        battery: int | None = watch_location.get("watch_battery")
+        is_online = online_status == WatchOnlineStatus.ONLINE.value
+        location = self.get_location(watch_location)
+        location_name, licence = await self.get_map(wuid, location["lat"], location["lng"], location["location_accuracy"])
+        if not is_online:
+            location.update(lat=None, lng=None)
+
+        return {
+            "battery": battery if battery not in (None, -1) else None,
+            "is_charging": watch_location.get("watch_charging", False) if battery not in (None, -1) else None,
+            "is_online": is_online,
+            "is_safezone": not watch_location.get("isInSafeZone", False),
+            "step_day": (user_steps or {}).get("day"),
+            "location_name": location_name,
+            "licence": licence,
+            **location,
+        }
+
+    async def get_message_data(self, wuid: str, message_limit, remove_message) -> dict[str, Any]:
+        """Fetch the unread counter and the chats of a watch."""
+        unread_msg, chats = await self.chat_sync.async_sync(self.controller, wuid, message_limit, remove_message)
+        if chats is None:
+            return {"unread_msg": unread_msg}
+        return {"unread_msg": unread_msg, "chats": chats}
+
+    async def get_config_data(self, wuid: str) -> dict[str, Any]:
+        """Fetch the rarely changing alarms, silent times, safe zones and watch information."""
+        alarm, silent, safe_zones, watch = await asyncio.gather(
+            self.controller.getWatchAlarm(wuid=wuid),
+            self.controller.getSilentTime(wuid),
+            self.controller.getWatchSafeZones(wuid),
+            self.controller.getWatches(wuid),
+        )
+        return {
+            "alarm": tuple(alarm),
+            "silent": tuple(silent),
+            "safe_zones": tuple(safe_zones),
+            "xcoin": self.controller.getWatchUserXCoins(wuid),
+            **self.get_watch_functions(wuid, watch),
+        }
+
+    def get_watch_functions(self, wuid: str, watch: dict[str, Any]) -> dict[str, Any]:
+        """Get the static information of a watch."""
+        return {
+            "imei": watch.get(ATTR_TRACKER_IMEI, wuid),
+            "entity_picture": self.controller.getWatchUserIcons(wuid),
+            "os_version": watch.get("osVersion", "n/a"),
+            "model": watch.get("model", "GPS-Watch"),
+        }
+
+    def get_location(self, watch_location: dict[str, Any]) -> dict[str, Any]:
+        """Get location information from the last location of a watch."""
+        return {
+            "lat": float(watch_location[ATTR_TRACKER_LAT]) if watch_location.get(ATTR_TRACKER_LAT) else None,
+            "lng": float(watch_location[ATTR_TRACKER_LNG]) if watch_location.get(ATTR_TRACKER_LNG) else None,
+            "poi": watch_location.get(ATTR_TRACKER_POI) or None,
+            "location_accuracy": self._accuracy(watch_location.get(ATTR_TRACKER_RAD)),
+            "locate_type": watch_location.get("locateType", LocationType.UNKNOWN.value),
+            "last_track_time": watch_location.get("tm", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        }
+
+    @staticmethod
+    def _accuracy(value: Any) -> int:
+        """Return the accuracy radius of a fix in meters, -1 if the watch did not report a usable one."""
+        try:
+            return int(float(value))
+        except (TypeError, ValueError, OverflowError):
+            return -1
+
+    def _is_same_fix(self, wuid: str, lat: float, lng: float) -> bool:
+        """Return True if a position is within the accuracy or the gating distance of the last geocoded fix."""
+        if (fix := self._geocoded_fix.get(wuid)) is None:
+            return False
+        moved = distance.distance((fix[0], fix[1]), (lat, lng)).m
+        return moved <= max(fix[2], self._geocode_distance)
+
+    def _zones(self, wuid: str, safe_zones: tuple[dict[str, Any], ...]) -> tuple[ZoneIndex, DistanceEngine]:
+        """Return zone index and distance engine of the safe zones of a watch and the Home Assistant zones."""
+        zone_states = self.hass.states.async_all(ZONE_DOMAIN)
+        signature = (safe_zones, tuple((state.entity_id, state.last_updated) for state in zone_states))
+        cached = self._zone_sets.get(wuid)
+        if cached is None or cached[0] != signature:
+            zones = [safe_zone_to_zone(safe_zone) for safe_zone in safe_zones]
+            zones += [state_to_zone(state) for state in zone_states]
+            valid_zones = [zone for zone in zones if zone is not None]
+            cached = (signature, ZoneIndex(valid_zones), DistanceEngine(valid_zones))
+            self._zone_sets[wuid] = cached
+            _LOGGER.debug("Rebuilt zones of %s", wuid[25:])
+        return cached[1], cached[2]
+
+    def zone_name(self, wuid: str, lat: float, lng: float, previous: WatchSnapshot | None) -> str | None:
+        """Return the name of the safe zone or Home Assistant zone a position is in."""
+        zone_index, _ = self._zones(wuid, previous.safe_zones if previous else ())
+        zone = zone_index.find(lat, lng)
+        return zone.name if zone else None
+
+    def _home_safezone(self) -> Zone | None:
+        """Return the home circle that counts as safe zone, None if the option is off or home is unknown."""
+        if self._entry.options.get(CONF_HOME_SAFEZONE, STATE_OFF) != STATE_ON:
+            return None
+        home_state = self.hass.states.get(HOME)
+        if not home_state or not home_state.attributes:
+            return None
+        return Zone(
+            home_state.name,
+            float(self._entry.options.get(CONF_HOME_LATITUDE, home_state.attributes[CONF_LATITUDE])),
+            float(self._entry.options.get(CONF_HOME_LONGITUDE, home_state.attributes[CONF_LONGITUDE])),
+            float(self._entry.options.get(CONF_HOME_RADIUS, home_state.attributes[CONF_RADIUS])),
+            GEOFENCE_HOME_SAFEZONE,
+        )
+
+    def get_distances(self, snapshot: WatchSnapshot) -> dict[str, Any]:
+        """Compute the distances of a snapshot to home and to all zones once per update."""
+        if not (snapshot.lat and snapshot.lng):
+            return {"home_distance": None, "zone_distances": {}}
+        _, engine = self._zones(snapshot.watch_id, snapshot.safe_zones)
+        zone_distances = engine.distances(snapshot.lat, snapshot.lng)
+        if (home := self._home_safezone()) is not None:
+            zone_distances[home.zone_id] = int(haversine_meter(snapshot.lat, snapshot.lng, home.lat, home.lng))
+        return {"home_distance": zone_distances.get(HOME), "zone_distances": zone_distances}
+
+    def get_history(self, snapshot: WatchSnapshot) -> dict[str, Any]:
+        """Add a new fix to the location history of a watch and return the values derived from it."""
+        if self.history is None:
+            return {}
+        history = self.history.get(snapshot.watch_id)
+        if snapshot.lat and snapshot.lng and (fix_time := self._fix_time(snapshot.last_track_time)) is not None:
+            if history.append(
+                fix_time.timestamp(),
+                snapshot.lat,
+                snapshot.lng,
+                snapshot.location_accuracy,
+                locate_type=snapshot.locate_type,
+                day=dt_util.as_local(fix_time).date().toordinal(),
+            ):
+                self.history.async_delay_save()
+        if not history.size:
+            return {}
+        return {
+            "speed": round(history.speed, 1),
+            "distance_today": history.distance_on(dt_util.now().date().toordinal()),
+            "last_moved": dt_util.utc_from_timestamp(history.last_moved),
+        }
+
+    @staticmethod
+    def _fix_time(last_track_time: str | None) -> datetime | None:
+        """Return the time of a fix, given in the local time of Home Assistant."""
+        if not last_track_time or (fix_time := dt_util.parse_datetime(last_track_time)) is None:
+            return None
+        if fix_time.tzinfo is None:
+            fix_time = fix_time.replace(tzinfo=dt_util.get_default_time_zone())
+        return fix_time
+
+    def get_geofence(self, snapshot: WatchSnapshot) -> dict[str, Any]:
+        """Update the zone membership of a watch and fire an event for each zone it entered or left.
+
+        Without a position the last known membership is kept.
+        """
+        if not (snapshot.lat and snapshot.lng):
+            return {}
+        _, engine = self._zones(snapshot.watch_id, snapshot.safe_zones)
+        zones = {zone.zone_id: zone for zone in engine.zones}
+        if (home := self._home_safezone()) is not None:
+            zones[home.zone_id] = home
+        geofence = self._geofences.setdefault(snapshot.watch_id, Geofence())
+        for transition in geofence.update(zones, snapshot.zone_distances, snapshot.location_accuracy):
+            _LOGGER.debug(
+                "%s %s %s", snapshot.watch_id[25:], "entered" if transition.entered else "left", transition.zone.name
+            )
+            self.hass.bus.async_fire(
+                EVENT_XPLORA_GEOFENCE,
+                {
+                    "watch_id": snapshot.watch_id,
+                    "event": "enter" if transition.entered else "exit",
+                    "zone_id": transition.zone.zone_id,
+                    "zone": transition.zone.name,
+                    "distance": transition.distance,
+                    "latitude": snapshot.lat,
+                    "longitude": snapshot.lng,
+                    "accuracy": snapshot.location_accuracy,
+                },
             )
+        fields: dict[str, Any] = {"in_zones": tuple(sorted(geofence.inside))}
+        if home is not None:
+            fields["in_home_safezone"] = home.zone_id in geofence.inside
+        if snapshot.safe_zones:
+            fields["is_safezone"] = not any(zone_id.startswith(SAFE_ZONE_PREFIX) for zone_id in geofence.inside)
+        return fields
+
+    @property
+    def geocode_session(self) -> aiohttp.ClientSession:
+        """Return the pooled keep-alive session of Home Assistant used for all map providers."""
+        return aiohttp_client.async_get_clientsession(self.hass)
+
+    async def get_map(
+        self, wuid: str, lat: float | None, lng: float | None, accuracy: int = -1
+    ) -> tuple[str | None, str | None]:
+        """Get map, falling back to the last known address of the watch."""
+        previous: WatchSnapshot | None = self.data.get(wuid) if self.data else None
+        location_name = previous.location_name if previous else None
+        licence = previous.licence if previous else None
+        if lat and lng and (zone_name := self.zone_name(wuid, lat, lng, previous)) is not None:
+            self.zone_hit_count += 1
+            self._geocoded_fix.pop(wuid, None)
+            return zone_name, None
+        if lat and lng and self._maps in MAPS:
+            if location_name and self._is_same_fix(wuid, lat, lng):
+                self.geocode_skip_count += 1
+                _LOGGER.debug("Keep address of %s, the watch has not moved", wuid[25:])
+                return location_name, licence
+            self.geocode_count += 1
+            result = await self.reverse_geocode(lat, lng)
+            if result[0]:
+                # Only a resolved address may gate the next lookups, else the old one would stick.
+                self._geocoded_fix[wuid] = (lat, lng, accuracy)
+            location_name = result[0] or location_name
+            licence = result[1] or licence
+        return location_name, licence
+
+    async def reverse_geocode(self, lat: float, lng: float) -> tuple[str | None, str | None]:
+        """Get the address of a position from the cache or from the configured map."""
+        if self._maps == MAPS[2]:
+            return self.offline_location(lat, lng)
+        language = self._entry.options.get(CONF_LANGUAGE, self._entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE))
+        cache_key = self.geocode_cache.key(lat, lng, self._maps, language)
+        if self.geocode_cache.ttl and (cached := self.geocode_cache.get(cache_key)) is not None:
+            return cached
+        result, provider = await self.geocode_chain.async_lookup(lat, lng, (lat, lng, language))
+        # The cache holds answers of the configured map only, never a fallback with its attribution.
+        if self.geocode_cache.ttl and result[0] and provider == self._maps:
+            self.geocode_cache.set(cache_key, *result)
+        return result
+
+    async def async_reverse_geocode_many(
+        self, positions: Sequence[tuple[float, float]]
+    ) -> list[tuple[str | None, str | None] | Exception]:
+        """Get the addresses of many positions in the given order, e.g. to backfill stored locations.
+
+        Cached cells are answered from the cache and every other cell is looked up
+        once. With opencagedata.com the cells are sent as one batch through the
+        shared queue of the provider, any other online map resolves them through
+        its queue as well, so the batch keeps to the rate limit of the polls. Per
+        position, the address and licence or the error of its lookup is returned.
+        """
+        if self._maps == MAPS[2]:
+            return [self.offline_location(lat, lng) for lat, lng in positions]
+        language = self._entry.options.get(CONF_LANGUAGE, self._entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE))
+        addresses: list[tuple[str | None, str | None] | Exception] = [(None, None)] * len(positions)
+        misses: dict[str, list[int]] = {}
+        for index, (lat, lng) in enumerate(positions):
+            cache_key = self.geocode_cache.key(lat, lng, self._maps, language)
+            if self.geocode_cache.ttl and (cached := self.geocode_cache.get(cache_key)) is not None:
+                addresses[index] = cached
+            else:
+                misses.setdefault(cache_key, []).append(index)
+        if not misses:
+            return addresses
+
+        cells = [positions[indexes[0]] for indexes in misses.values()]
+        answers: list[tuple[str | None, str | None] | BaseException]
+        if self._maps == MAPS[1]:
+            async with OpenCageGeocodeUA(
+                self._opencage_apikey,
+                session=self.geocode_session,
+                timeout=GEOCODE_REQUEST_TIMEOUT,
+                max_time=GEOCODE_DEADLINE - GEOCODE_REQUEST_TIMEOUT,
+            ) as geocoder:
+                results = await geocoder.reverse_geocode_batch_async(
+                    cells,
+                    queue=get_geocode_queue(self.hass, MAPS[1]),
+                    concurrency=GEOCODE_BATCH_CONCURRENCY,
+                    **_OPENCAGE_PARAMS,
+                )
+            answers = [result if isinstance(result, Exception) else self._opencage_result(*result) for result in results]
+        else:
+            semaphore = asyncio.Semaphore(GEOCODE_BATCH_CONCURRENCY)
+
+            async def lookup(lat: float, lng: float) -> tuple[str | None, str | None]:
+                async with semaphore:
+                    return await self._async_queued(self._maps, self.openstreetmap, lat, lng)
+
+            answers = await asyncio.gather(*(lookup(lat, lng) for lat, lng in cells), return_exceptions=True)
+
+        for (cache_key, indexes), answer in zip(misses.items(), answers, strict=True):
+            if isinstance(answer, BaseException) and not isinstance(answer, Exception):
+                raise answer
+            if not isinstance(answer, Exception) and self.geocode_cache.ttl and answer[0]:
+                self.geocode_cache.set(cache_key, *answer)
+            for index in indexes:
+                addresses[index] = answer
+        _LOGGER.debug("Resolved %s of %s positions from %s", len(misses), len(positions), self._maps)
+        return addresses
+
+    def offline_location(self, lat: float, lng: float) -> tuple[str | None, str | None]:
+        """Get the nearest place of the local dataset without any network call."""
+        if self.offline_geocoder is None:
+            return None, None
+        return self.offline_geocoder.reverse_geocode(lat, lng), OFFLINE_LICENCE
+
+    async def _async_queued(
+        self, provider: str, lookup: Callable[[float, float], Awaitable[tuple[str | None, str | None]]], lat: float, lng: float
+    ) -> tuple[str | None, str | None]:
+        """Run a lookup through the rate limited queue of its provider, raising GeocodeSkippedError while it is paused."""
+        language = self._entry.options.get(CONF_LANGUAGE, self._entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE))
+        queue = get_geocode_queue(self.hass, provider)
+        return await queue.async_run(
+            (lat, lng, language), partial(lookup, lat, lng), timeout=GEOCODE_TIMEOUTS.get(provider, GEOCODE_DEADLINE)
+        )
 
-            await self.get_watch_functions(wuid, self.device)
-            await self.get_map()
-            data.update(self.get_data(wuid, chats))
-        return data
-
-    async def get_watch_functions(self, wuid: str, device: dict[str, Any]):
-        """Get functions that need to be called when a watch is created."""
-        await self.init(aiohttp_client.async_get_clientsession(self.hass))
-        self.alarm = await self.controller.getWatchAlarm(wuid=wuid)  # device.get("getWatchAlarm", [])
-        self.silent = device.get("getSilentTime", [])
-
-        sw_version: dict[str, Any] = device.get("getWatches", {})
-        self.imei = sw_version.get(ATTR_TRACKER_IMEI, wuid)
-        self.watch_id = wuid
-        self.os_version = sw_version.get("osVersion", "n/a")
-        self.model = sw_version.get("model", "GPS-Watch")
-        self.entity_picture = device.get("getWatchUserIcons", "")
-
-        self._step_day = device.get("getWatchUserSteps", {}).get("day")
-        self._xcoin = device.get("getWatchUserXCoins", 0)
-
-    def get_location(self, watch_location):
-        """Get location information from device."""
-        self.lat = float(self.device.get(ATTR_TRACKER_LAT, 0.0)) if self.device.get(ATTR_TRACKER_LAT, None) else None
-        self.lng = float(self.device.get(ATTR_TRACKER_LNG, 0.0)) if self.device.get(ATTR_TRACKER_LNG, None) else None
-        self.poi = watch_location.get(ATTR_TRACKER_POI, None)
-        self.location_accuracy = self.device.get(ATTR_TRACKER_RAD, -1)
-        self.locate_type = watch_location.get("locateType", LocationType.UNKNOWN.value)
-        self.last_track_time = self.device.get("lastTrackTime", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-
-    async def get_map(self):
-        """Get map."""
-        if self._maps == MAPS[1] and self.lat and self.lng:
-            await self.opencagedata()
-        elif self._maps == MAPS[0] and self.lat and self.lng:
-            await self.openstreetmap()
-
-    async def mapbox(self):
+    async def mapbox(self, lat: float, lng: float) -> tuple[str | None, str | None]:
         """Get mapbox information for the location."""
+        return await self._async_queued(MAPBOX, self._mapbox, lat, lng)
+
+    async def _mapbox(self, lat: float, lng: float) -> tuple[str | None, str | None]:
         language = self._entry.options.get(CONF_LANGUAGE, self._entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE))
-        async with aiohttp.ClientSession() as session:
-            url = URL_MAPBOX.format(self.lng, self.lat, API_KEY_MAPBOX, language)
-            async with session.get(url) as response:
-                data = await response.json()
-                if data["features"]:
-                    self.location_name = data["features"][0]["place_name"]
-                    self.licence = data["attribution"]
-                self.licence = data["attribution"]
-
-    async def opencagedata(self):
+        url = URL_MAPBOX.format(lng, lat, API_KEY_MAPBOX, language)
+        async with self.geocode_session.get(url, timeout=aiohttp.ClientTimeout(DEFAULT_TIMEOUT)) as response:
+            data = await response.json()
+            if data["features"]:
+                return data["features"][0]["place_name"], data["attribution"]
+            return None, data["attribution"]
+
+    async def opencagedata(self, lat: float, lng: float) -> tuple[str | None, str | None]:
         """Get opencagedata.com information for the location.."""
+        queue = get_geocode_queue(self.hass, MAPS[1])
         try:
-            async with OpenCageGeocodeUA(self._opencage_apikey) as geocoder:
-                results: list[Any] = await geocoder.reverse_geocode_async(
-                    self.lat, self.lng, no_annotations=1, pretty=1, no_record=1, no_dedupe=1, limit=1, abbrv=1
-                )
-                self.location_name = results[0]["formatted"]
-                self.licence = (await geocoder.licenses_async(self.lat, self.lng))[0]["url"]
-                _LOGGER.debug("load address from opencagedata.com")
-        except aiohttp.ContentTypeError:
-            _LOGGER.debug("error about open.com using mapbox.com")
-            await self.mapbox()
-
-    async def openstreetmap(self):
+            async with (
+                asyncio.timeout(GEOCODE_DEADLINE),
+                OpenCageGeocodeUA(
+                    self._opencage_apikey,
+                    session=self.geocode_session,
+                    timeout=GEOCODE_REQUEST_TIMEOUT,
+                    max_time=GEOCODE_DEADLINE - GEOCODE_REQUEST_TIMEOUT,
+                ) as geocoder,
+            ):
+                results, licences = await geocoder.reverse_geocode_with_licenses_async(lat, lng, **_OPENCAGE_PARAMS)
+        except RateLimitExceededError as error:
+            queue.pause(error.reset_time)
+            raise GeocodeSkippedError(MAPS[1], throttled=True) from error
+        except (OpenCageGeocodeError, aiohttp.ClientError, TimeoutError) as error:
+            queue.record_failure()
+            _LOGGER.debug("Unable to load address from opencagedata.com: %s", error or type(error).__name__)
+            raise
+        queue.record_success()
+        _LOGGER.debug("load address from opencagedata.com")
+        return self._opencage_result(results, licences)
+
+    def _opencage_result(self, results: list[dict[str, Any]], licences: list[dict[str, str]]) -> tuple[str | None, str | None]:
+        if licences:
+            self._licences[MAPS[1]] = licences[0]["url"]
+        return results[0]["formatted"] if results else None, self._licences.get(MAPS[1])
+
+    async def openstreetmap(self, lat: float, lng: float) -> tuple[str | None, str | None]:
         """Get OpenStreetMap.org information for the location.."""
         try:
             language = self._entry.options.get(CONF_LANGUAGE, self._entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE))
-            async with (
-                aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(DEFAULT_TIMEOUT)) as session,
-                session.get(URL_OPENSTREETMAP.format(self.lat, self.lng, language)) as response,
-            ):
+            async with self.geocode_session.get(
+                URL_OPENSTREETMAP.format(lat, lng, language), timeout=aiohttp.ClientTimeout(DEFAULT_TIMEOUT)
+            ) as response:
+                if response.status == 429:
+                    retry_after = response.headers.get("Retry-After", "")
+                    get_geocode_queue(self.hass, MAPS[0]).pause(
+                        int(retry_after) if retry_after.isdigit() else GEOCODE_RETRY_AFTER
+                    )
+                    raise GeocodeSkippedError(MAPS[0], throttled=True)
                 res: dict[str, Any] = await response.json()
-                self.licence = res.get(ATTR_TRACKER_LICENCE)
                 address: dict[str, str] = res.get(ATTR_TRACKER_ADDR, {})
+                location_name = None
                 if address:
-                    self.location_name = res.get("display_name", "")
+                    location_name = res.get("display_name", "")
                     _LOGGER.debug("load address from openstreetmap.org")
+                return location_name, res.get(ATTR_TRACKER_LICENCE)
         except aiohttp.ContentTypeError:
-            _LOGGER.debug("error about openstreetmap.org using mapbox.com")
-            await self.mapbox()
-
-    def get_data(self, wuid, chats):
-        """Get data for a given wuid."""
-        return {
-            wuid: {
-                "unreadMsg": self.unread_msg,
-                ATTR_BATTERY: self.battery if self.battery != -1 else None,
-                "isCharging": self.is_charging if self.battery != -1 else None,
-                "isOnline": self.is_online,
-                "isSafezone": self.is_safezone,
-                "alarm": self.alarm,
-                "silent": self.silent,
-                "step_day": self._step_day,
-                SENSOR_XCOIN: self._xcoin,
-                ATTR_TRACKER_LAT: self.lat if self.is_online else None,
-                ATTR_TRACKER_LNG: self.lng if self.is_online else None,
-                ATTR_TRACKER_POI: self.poi if self.poi else None,
-                ATTR_LOCATION_NAME: self.location_name,
-                ATTR_TRACKER_IMEI: self.imei,
-                "location_accuracy": self.location_accuracy,
-                "entity_picture": self.entity_picture,
-                "os_version": self.os_version,
-                "model": self.model,
-                "watch_id": self.watch_id,
-                "locateType": self.locate_type,
-                "lastTrackTime": self.last_track_time,
-                ATTR_TRACKER_LICENCE: self.licence,
-                SENSOR_MESSAGE: chats,
-            }
-        }
+            _LOGGER.debug("error about openstreetmap.org")
+            raise
 
-    async def message_data(self, wuid, message_limit, remove_message) -> dict | ChatsNew:
-        """Fetch message chats from Xplora."""
-        watch_entry = {}
-        if self.data:
-            watch_entry.update(self.data)
+    async def message_data(self, wuid, message_limit, remove_message) -> dict[str, Any]:
+        """Sync message chats from Xplora and return the chat window of the watch."""
         _LOGGER.debug("Fetch message data from Xplora: %s", wuid[25:])
-        res_chats = await self.controller.getWatchChatsRaw(wuid, limit=message_limit, show_del_msg=remove_message)
-        chats = ChatsNew.from_dict(res_chats).to_dict()
-        watch_entry.update({wuid: {SENSOR_MESSAGE: chats}})
-        self.data = watch_entry
-        return res_chats
+        unread_msg, chats = await self.chat_sync.async_sync(self.controller, wuid, message_limit, remove_message)
+        if self.data and wuid in self.data:
+            self.data[wuid] = replace(self.data[wuid], unread_msg=unread_msg, chats=chats or self.chat_sync.chats(wuid))
+        return self.chat_sync.chats(wuid)
+
+
+class XploraWatchCoordinator(DataUpdateCoordinator[WatchSnapshot]):
+    """Poll a single watch through the session of its account coordinator."""
+
+    def __init__(self, hass: HomeAssistant, account: XploraDataUpdateCoordinator, wuid: str) -> None:
+        """Initialize the coordinator of one watch."""
+        self.account = account
+        self.watch_uid = wuid
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{account.name}-{wuid[25:]}",
+            update_interval=account.watch_update_interval,
+        )
+
+    @property
+    def controller(self) -> PyXploraApi:
+        """Return the controller of the account."""
+        return self.account.controller
+
+    @property
+    def username(self) -> str:
+        """Return the name of the account."""
+        return self.account.username
+
+    @property
+    def user_id(self) -> str:
+        """Return the user id of the account."""
+        return self.account.user_id
+
+    @callback
+    def async_set_updated_data(self, data: WatchSnapshot) -> None:
+        """Set a snapshot fetched by the account and reschedule the next poll."""
+        self._async_adapt_update_interval(data)
+        super().async_set_updated_data(data)
+
+    @callback
+    def _async_adapt_update_interval(self, snapshot: WatchSnapshot) -> None:
+        """Pick the next poll interval from the previous and the new snapshot."""
+        if self.account.scheduler is None:
+            return
+        update_interval = self.account.scheduler.next_interval(self.data, snapshot)
+        if update_interval != self.update_interval:
+            _LOGGER.debug("Poll %s every %s", self.watch_uid[25:], update_interval)
+        self.update_interval = update_interval
+
+    async def _async_update_data(self) -> WatchSnapshot:
+        """Fetch the data of this watch only."""
+        snapshots = await self.account.async_fetch_watches([self.watch_uid])
+        snapshot = snapshots[self.watch_uid]
+        self._async_adapt_update_interval(snapshot)
+        return snapshot
@@ -7,7 +7,6 @@ from typing import Any
 
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
-from homeassistant.components.device_tracker.const import ATTR_BATTERY, ATTR_LOCATION_NAME
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ID, CONF_NAME
 from homeassistant.core import HomeAssistant
@@ -33,9 +32,8 @@ from .const import (
     DEVICE_TRACKER_WATCH,
     DOMAIN,
 )
-from .coordinator import XploraDataUpdateCoordinator
+from .coordinator import XploraDataUpdateCoordinator, XploraWatchCoordinator
 from .entity import XploraBaseEntity
-from .helper import get_location_distance_meter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,17 +68,17 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
         ):
             continue
 
+        watch_coordinator = coordinator.watch_coordinators[wuid]
         if DEVICE_TRACKER_SAFZONES in conf_tyes:
-            safe_zones = await coordinator.controller.getWatchSafeZones(wuid)
-            for safe_zone in safe_zones:
-                entities.append(XploraSafezoneTracker(config_entry, safe_zone, coordinator, wuid, ward))
+            for safe_zone in watch_coordinator.data.safe_zones:
+                entities.append(XploraSafezoneTracker(config_entry, safe_zone, watch_coordinator, wuid, ward))
         if DEVICE_TRACKER_WATCH in config_entry.options.get(CONF_TYPES):
-            image = coordinator.data[wuid].get("entity_picture", None)
+            image = watch_coordinator.data.entity_picture or None
             session = async_get_clientsession(hass)
             resp = await session.get(url=image, timeout=5)
             if image is None or resp.status != 200:
                 image = "https://s3.eu-central-1.amazonaws.com/kids360uc/default_icon.png"
-            entities.append(XploraDeviceTracker(hass, config_entry, coordinator, wuid, ward, image))
+            entities.append(XploraDeviceTracker(hass, config_entry, watch_coordinator, wuid, ward, image))
     async_add_entities(entities)
 
 
@@ -94,7 +92,7 @@ class XploraSafezoneTracker(XploraBaseEntity, TrackerEntity, RestoreEntity):
         self,
         config_entry: ConfigEntry,
         safezone: dict[str, Any],
-        coordinator: XploraDataUpdateCoordinator,
+        coordinator: XploraWatchCoordinator,
         wuid: str,
         ward: dict[str, Any],
     ) -> None:
@@ -161,14 +159,14 @@ class XploraDeviceTracker(XploraBaseEntity, TrackerEntity):
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
-        coordinator: XploraDataUpdateCoordinator,
+        coordinator: XploraWatchCoordinator,
         wuid: str,
         ward: dict[str, Any],
         image: str,
     ) -> None:
         """Initialize the Tracker."""
         super().__init__(config_entry, None, coordinator, wuid)
-        if self.watch_uid not in coordinator.data:
+        if coordinator.data is None:
             return
 
         self._hass = hass
@@ -186,17 +184,17 @@ class XploraDeviceTracker(XploraBaseEntity, TrackerEntity):
     @property
     def battery_level(self) -> int | None:
         """Return battery value of the device."""
-        return self.coordinator.data[self.watch_uid].get(ATTR_BATTERY, None)
+        return self.coordinator.data.battery
 
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        return self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LAT, None)
+        return self.coordinator.data.lat
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        return self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LNG, None)
+        return self.coordinator.data.lng
 
     @property
     def source_type(self) -> SourceType | str:
@@ -206,41 +204,29 @@ class XploraDeviceTracker(XploraBaseEntity, TrackerEntity):
     @property
     def location_accuracy(self) -> int:
         """Return the gps accuracy of the device."""
-        return self.coordinator.data[self.watch_uid].get("location_accuracy", 0)
+        return self.coordinator.data.location_accuracy
 
     @property
     def address(self) -> str | None:
         """Return a location name for the current location of the device."""
-        return self.coordinator.data[self.watch_uid].get(ATTR_LOCATION_NAME, None)
+        return self.coordinator.data.location_name
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return state attributes that should be added to DEVICE_STATE."""
         data = super().extra_state_attributes or {}
-        distance_to_home = None
-
-        if self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LAT, None) and self.coordinator.data[self.watch_uid].get(
-            ATTR_TRACKER_LNG, None
-        ):
-            lat_lng: tuple[float, float] = (
-                float(self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LAT, None)),
-                float(self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LNG, None)),
-            )
-            distance_to_home = get_location_distance_meter(self._hass, lat_lng)
+        snapshot = self.coordinator.data
+        distance_to_home = snapshot.home_distance
 
         return dict(
             data,
             **{
                 ATTR_SERVICE_USER: self.coordinator.username,
                 ATTR_TRACKER_DISTOHOME: distance_to_home,
-                ATTR_TRACKER_ADDR: (
-                    self.coordinator.data[self.watch_uid].get(ATTR_LOCATION_NAME, None) if distance_to_home else None
-                ),
-                ATTR_TRACKER_LAST_TRACK: (
-                    self.coordinator.data[self.watch_uid].get("lastTrackTime", None) if distance_to_home else None
-                ),
-                ATTR_TRACKER_IMEI: self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_IMEI, None),
-                ATTR_TRACKER_POI: self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_POI, None),
-                ATTR_TRACKER_LICENCE: self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LICENCE, None),
+                ATTR_TRACKER_ADDR: snapshot.location_name if distance_to_home else None,
+                ATTR_TRACKER_LAST_TRACK: snapshot.last_track_time if distance_to_home else None,
+                ATTR_TRACKER_IMEI: snapshot.imei,
+                ATTR_TRACKER_POI: snapshot.poi,
+                ATTR_TRACKER_LICENCE: snapshot.licence,
             },
         )
@@ -0,0 +1,28 @@
+"""Diagnostics support for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_TRANSCODER, DOMAIN
+from .transcoder import AudioTranscoder, TranscodeStatus
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return the state of the voice message transcoder, shared by all config entries."""
+    transcoder: AudioTranscoder | None = hass.data.get(DOMAIN, {}).get(DATA_TRANSCODER)
+    if transcoder is None:
+        return {"transcoder": None}
+    return {
+        "transcoder": {
+            **transcoder.stats(),
+            "failed_jobs": [
+                {"msg_id": job.msg_id, "error": job.error}
+                for job in transcoder.jobs.values()
+                if job.status is TranscodeStatus.FAILED
+            ][-10:],
+        }
+    }
@@ -0,0 +1,39 @@
+"""Distance engine for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import math
+
+from .offline_geocoder import EARTH_RADIUS
+from .zone_index import Zone
+
+
+class DistanceEngine:
+    """Distances from a position to a fixed set of zones in one pass.
+
+    Radians and cosines of the zone centers are computed once when the engine is
+    built, so each position only costs one haversine term per zone.
+    """
+
+    def __init__(self, zones: Sequence[Zone]) -> None:
+        """Prepare the zone centers."""
+        self.zones = tuple(zones)
+        self._lats = tuple(math.radians(zone.lat) for zone in self.zones)
+        self._lngs = tuple(math.radians(zone.lng) for zone in self.zones)
+        self._cos_lats = tuple(math.cos(lat) for lat in self._lats)
+
+    def distances(self, lat: float, lng: float) -> dict[str, int]:
+        """Return the distance in meters from a position to each zone, keyed by zone id."""
+        phi = math.radians(lat)
+        lam = math.radians(lng)
+        cos_phi = math.cos(phi)
+        sin, asin, sqrt = math.sin, math.asin, math.sqrt
+        return {
+            zone.zone_id: int(
+                2
+                * EARTH_RADIUS
+                * asin(min(1.0, sqrt(sin((zone_lat - phi) / 2) ** 2 + cos_phi * cos_lat * sin((zone_lng - lam) / 2) ** 2)))
+            )
+            for zone, zone_lat, zone_lng, cos_lat in zip(self.zones, self._lats, self._lngs, self._cos_lats, strict=True)
+        }
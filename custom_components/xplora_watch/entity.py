@@ -14,12 +14,12 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, DEVICE_NAME, DOMAIN, MANUFACTURER, TRACKER_UPDATE_STR
-from .coordinator import XploraDataUpdateCoordinator
+from .coordinator import XploraWatchCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class XploraBaseEntity(CoordinatorEntity[XploraDataUpdateCoordinator], RestoreEntity):
+class XploraBaseEntity(CoordinatorEntity[XploraWatchCoordinator], RestoreEntity):
     """Common base for Xplora® entities."""
 
     _attr_attribution = ATTRIBUTION
@@ -30,7 +30,7 @@ class XploraBaseEntity(CoordinatorEntity[XploraDataUpdateCoordinator], RestoreEn
         self,
         config_entry: ConfigEntry,
         description: EntityDescription | None,
-        coordinator: XploraDataUpdateCoordinator,
+        coordinator: XploraWatchCoordinator,
         wuid: str,
     ) -> None:
         """Initialize entity."""
@@ -44,16 +44,18 @@ class XploraBaseEntity(CoordinatorEntity[XploraDataUpdateCoordinator], RestoreEn
         self.watch_uid = wuid
         self._unsub_dispatchers: list[Callable[[], None]] = []
 
-        self.is_admin = " (Admin)-" if coordinator.is_admin.get(coordinator.user_id + config_entry.entry_id, None) else "-"
+        self.is_admin = (
+            " (Admin)-" if coordinator.account.is_admin.get(coordinator.user_id + config_entry.entry_id, None) else "-"
+        )
 
         self.watch_name = self.coordinator.controller.getWatchUserNames(wuid=self.watch_uid)
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{self._config_entry.unique_id}_{self.watch_uid}")},
             manufacturer=MANUFACTURER,
-            model=coordinator.data[self.watch_uid].get("model", DEVICE_NAME),
+            model=coordinator.data.model or DEVICE_NAME,
             name=f"{coordinator.username}{self.is_admin}{self.watch_name} ({self.watch_uid})",
-            sw_version=coordinator.os_version,
+            sw_version=coordinator.data.os_version,
             configuration_url="https://github.com/Ludy87/xplora_watch/blob/main/README.md",
         )
 
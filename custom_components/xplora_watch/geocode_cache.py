@@ -0,0 +1,106 @@
+"""Reverse geocode cache for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import GEOCODE_CACHE_SAVE_DELAY, GEOCODE_CACHE_SIZE, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash(lat: float, lng: float, precision: int) -> str:
+    """Encode a position as geohash with the given number of characters."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars: list[str] = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        value, value_range = (lng, lng_range) if even else (lat, lat_range)
+        middle = (value_range[0] + value_range[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            value_range[0] = middle
+        else:
+            value_range[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+class GeocodeCache:
+    """Least recently used cache of addresses per geohash cell, stored in .storage.
+
+    Entries expire after ``ttl`` seconds. Only the ``max_entries`` most recently
+    used cells are kept.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        precision: int,
+        ttl: int,
+        max_entries: int = GEOCODE_CACHE_SIZE,
+    ) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, list[Any]]] = Store(hass, STORAGE_VERSION, key)
+        self._entries: OrderedDict[str, tuple[str | None, str | None, float]] = OrderedDict()
+        self.precision = precision
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the cached addresses that have not expired yet."""
+        data = await self._store.async_load() or {}
+        now = time.time()
+        for key, (location_name, licence, created) in data.items():
+            if now - created < self.ttl:
+                self._entries[key] = (location_name, licence, created)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        _LOGGER.debug("Loaded %s cached addresses", len(self._entries))
+
+    def key(self, lat: float, lng: float, *scope: str) -> str:
+        """Return the cache key of the cell that contains a position."""
+        return "|".join((*scope, geohash(lat, lng, self.precision)))
+
+    def get(self, key: str) -> tuple[str | None, str | None] | None:
+        """Return address and licence of a cell, None if unknown or expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry[2] >= self.ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def set(self, key: str, location_name: str | None, licence: str | None) -> None:
+        """Remember the address of a cell and schedule a save."""
+        self._entries[key] = (location_name, licence, time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._store.async_delay_save(self._data_to_save, GEOCODE_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, list[Any]]:
+        return {key: list(entry) for key, entry in self._entries.items()}
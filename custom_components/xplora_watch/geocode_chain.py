@@ -0,0 +1,149 @@
+"""Reverse geocoding provider chain for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+import logging
+import math
+import time
+
+from .const import GEOCODE_HEDGE_MIN_SAMPLES, GEOCODE_LATENCY_SAMPLES
+from .geocode_queue import GeocodeQueue, GeocodeSkippedError
+
+_LOGGER = logging.getLogger(__name__)
+
+GeocodeResult = tuple[str | None, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class GeocodeProvider:
+    """A map provider with the lookup to call, the seconds it may take and the queue that paces it."""
+
+    name: str
+    lookup: Callable[[float, float], Awaitable[GeocodeResult]]
+    timeout: float
+    queue: GeocodeQueue | None = None
+
+
+@dataclass(slots=True)
+class ProviderStats:
+    """Latency and outcome of the recent lookups of one provider."""
+
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=GEOCODE_LATENCY_SAMPLES))
+    success_count: int = 0
+    empty_count: int = 0
+    error_count: int = 0
+    skip_count: int = 0
+    hedge_count: int = 0
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a latency percentile in seconds, None without enough samples."""
+        if len(self.latencies) < GEOCODE_HEDGE_MIN_SAMPLES:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(math.ceil(len(latencies) * percent / 100) - 1, len(latencies) - 1)]
+
+
+class GeocodeChain:
+    """Ask the providers in order until one of them answers.
+
+    Only a provider that fails, times out or is skipped by its open circuit
+    breaker hands over to the next one. An answer without an address ends the
+    chain, and so does a provider that reached its rate limit, so throttling
+    never shifts the load onto the next provider. A provider with a queue runs its lookups through
+    it, and the timeout and latency only cover the request, not the wait for its
+    turn. With ``hedge`` enabled, the next provider is also asked once the
+    current one takes longer than its 90th latency percentile, and the first
+    address wins.
+    """
+
+    def __init__(self, providers: Sequence[GeocodeProvider], hedge: bool = False) -> None:
+        """Initialize the chain."""
+        self.providers = list(providers)
+        self.hedge = hedge
+        self.stats: dict[str, ProviderStats] = {provider.name: ProviderStats() for provider in self.providers}
+
+    async def _async_timed(self, provider: GeocodeProvider, lat: float, lng: float, key: Hashable) -> GeocodeResult | None:
+        """Run one lookup, None if it failed."""
+        stats = self.stats[provider.name]
+        latency: float | None = None
+
+        async def request() -> GeocodeResult:
+            nonlocal latency
+            start = time.monotonic()
+            result = await provider.lookup(lat, lng)
+            latency = time.monotonic() - start
+            return result
+
+        try:
+            if provider.queue is None:
+                async with asyncio.timeout(provider.timeout):
+                    result = await request()
+            else:
+                result = await provider.queue.async_run(key, request, timeout=provider.timeout)
+        except GeocodeSkippedError:
+            stats.skip_count += 1
+            raise
+        except Exception as error:  # noqa: BLE001
+            stats.error_count += 1
+            _LOGGER.debug("Lookup of %s failed: %s", provider.name, error or type(error).__name__)
+            return None
+        # A lookup that joined a pending one of the queue has no latency of its own.
+        if latency is not None:
+            stats.latencies.append(latency)
+        if result and result[0]:
+            stats.success_count += 1
+        else:
+            stats.empty_count += 1
+        return result
+
+    async def async_lookup(self, lat: float, lng: float, key: Hashable | None = None) -> tuple[GeocodeResult, str | None]:
+        """Return address and licence of a position and the provider that knew the address.
+
+        Identical pending lookups in a provider queue are merged by ``key``, the
+        position by default. Without an address, the licence is the first one
+        seen and the provider is None.
+        """
+        key = (lat, lng) if key is None else key
+        licence: str | None = None
+        pending: dict[asyncio.Task[GeocodeResult | None], GeocodeProvider] = {}
+        index = 0
+        try:
+            while index < len(self.providers) or pending:
+                if not pending:
+                    provider = self.providers[index]
+                    index += 1
+                    pending[asyncio.create_task(self._async_timed(provider, lat, lng, key))] = provider
+                wait: float | None = None
+                if self.hedge and index < len(self.providers) and len(pending) == 1:
+                    wait = self.stats[next(iter(pending.values())).name].percentile(90)
+                done, _ = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    provider = self.providers[index]
+                    index += 1
+                    self.stats[provider.name].hedge_count += 1
+                    _LOGGER.debug("Hedging the slow lookup with %s", provider.name)
+                    pending[asyncio.create_task(self._async_timed(provider, lat, lng, key))] = provider
+                    continue
+                for task in done:
+                    provider = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except GeocodeSkippedError as error:
+                        if error.throttled:
+                            _LOGGER.debug("%s is throttled, not asking the next provider", provider.name)
+                            index = len(self.providers)
+                        continue
+                    if result is None:
+                        continue
+                    if result[0]:
+                        return result, provider.name
+                    licence = licence or result[1]
+                    index = len(self.providers)
+        finally:
+            for task in pending:
+                task.cancel()
+        return (None, licence), None
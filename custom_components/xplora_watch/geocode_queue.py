@@ -0,0 +1,132 @@
+"""Rate limited geocoding requests for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import datetime
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_GEOCODE_QUEUES, DOMAIN, GEOCODE_COOL_DOWN, GEOCODE_FAILURE_THRESHOLD, GEOCODE_RATE_LIMITS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GeocodeSkippedError(Exception):
+    """The provider is paused by its rate limit or circuit breaker, the lookup was not sent."""
+
+    def __init__(self, provider: str, *, throttled: bool) -> None:
+        """Initialize the error, throttled is False if only the circuit breaker is open."""
+        super().__init__(provider)
+        self.provider = provider
+        self.throttled = throttled
+
+
+class GeocodeQueue:
+    """Pace the requests to one map provider and merge identical pending lookups.
+
+    Requests start at most once per ``min_interval`` seconds. A lookup for a key
+    that is already pending joins the pending request. After the provider
+    reported a rate limit, no request is sent until the reset time. After
+    ``failure_threshold`` failed lookups in a row, the provider is skipped for
+    ``cool_down`` seconds; the first lookup after that decides whether it stays
+    skipped. The ``timeout`` of a lookup starts once it is its turn, so the wait in
+    the queue never counts against the provider. A skipped lookup raises
+    :class:`GeocodeSkippedError`, so callers can tell it apart from a position
+    without an address, and its ``throttled`` flag tells a reached rate limit
+    from an open circuit breaker.
+    """
+
+    def __init__(self, hass: HomeAssistant, provider: str, min_interval: float) -> None:
+        """Initialize the queue of a provider."""
+        self._hass = hass
+        self.provider = provider
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._pending: dict[Hashable, asyncio.Task[Any]] = {}
+        self._next_request = 0.0
+        self._paused_until = 0.0
+        self._open_until = 0.0
+        self.failure_threshold = GEOCODE_FAILURE_THRESHOLD
+        self.cool_down = GEOCODE_COOL_DOWN
+        self.failure_count = 0
+        self.request_count = 0
+        self.dedupe_count = 0
+
+    @property
+    def is_throttled(self) -> bool:
+        """Return True while the rate limit of the provider is reached."""
+        return time.monotonic() < self._paused_until
+
+    @property
+    def is_paused(self) -> bool:
+        """Return True while the provider does not accept requests."""
+        return self.is_throttled or time.monotonic() < self._open_until
+
+    def pause(self, reset_time: datetime | float) -> None:
+        """Stop sending requests until the given reset time or for the given seconds."""
+        if isinstance(reset_time, datetime):
+            seconds = (reset_time - dt_util.utcnow()).total_seconds()
+        else:
+            seconds = float(reset_time)
+        self._paused_until = max(self._paused_until, time.monotonic() + max(seconds, 0))
+        _LOGGER.warning("Rate limit of %s reached, pausing lookups for %.0f s", self.provider, seconds)
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful lookup."""
+        if self.failure_count >= self.failure_threshold:
+            _LOGGER.info("%s is available again", self.provider)
+        self.failure_count = 0
+
+    def record_failure(self) -> None:
+        """Count a failed lookup and open the circuit once the threshold is reached."""
+        self.failure_count += 1
+        if self.failure_count >= self.failure_threshold:
+            self._open_until = max(self._open_until, time.monotonic() + self.cool_down)
+            _LOGGER.warning(
+                "%s failed %s times in a row, skipping lookups for %s s", self.provider, self.failure_count, self.cool_down
+            )
+
+    async def async_run(self, key: Hashable, request: Callable[[], Awaitable[Any]], timeout: float | None = None) -> Any:
+        """Run a lookup in turn, raising GeocodeSkippedError while the provider is paused."""
+        if (task := self._pending.get(key)) is not None:
+            self.dedupe_count += 1
+            return await asyncio.shield(task)
+        if self.is_paused:
+            raise GeocodeSkippedError(self.provider, throttled=self.is_throttled)
+
+        task = self._hass.async_create_task(self._async_paced(request, timeout), f"{DOMAIN} geocode {self.provider}")
+        self._pending[key] = task
+
+        def _done(_: asyncio.Task[Any]) -> None:
+            if self._pending.get(key) is task:
+                del self._pending[key]
+
+        task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _async_paced(self, request: Callable[[], Awaitable[Any]], timeout: float | None) -> Any:
+        async with self._lock:
+            # A pause that starts while the lookup waits skips it, nothing waits for a reset time.
+            delay = self._next_request - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.is_paused:
+                raise GeocodeSkippedError(self.provider, throttled=self.is_throttled)
+            self._next_request = time.monotonic() + self.min_interval
+        self.request_count += 1
+        async with asyncio.timeout(timeout):
+            return await request()
+
+
+def get_geocode_queue(hass: HomeAssistant, provider: str) -> GeocodeQueue:
+    """Return the queue of a provider, shared by all config entries."""
+    queues: dict[str, GeocodeQueue] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_GEOCODE_QUEUES, {})
+    if provider not in queues:
+        queues[provider] = GeocodeQueue(hass, provider, GEOCODE_RATE_LIMITS.get(provider, 1.0))
+    return queues[provider]
@@ -11,6 +11,7 @@ https://raw.githubusercontent.com/OpenCageData/python-opencage-geocoder/master/L
 
 from __future__ import annotations  # noqa: I001
 
+import asyncio
 import collections
 import os
 import sys
@@ -31,6 +32,8 @@ except ImportError:
 
 DEFAULT_TIMEOUT = 60
 DEFAULT_DOMAIN = "api.opencagedata.com"
+DEFAULT_MAX_TRIES = 5
+DEFAULT_BATCH_CONCURRENCY = 4
 
 
 def backoff_max_time():
@@ -142,7 +145,9 @@ class OpenCageGeocodeUA:
     key = ""
     session = None
 
-    def __init__(self, key, protocol="https", domain=DEFAULT_DOMAIN, sslcontext=None):
+    def __init__(
+        self, key, protocol="https", domain=DEFAULT_DOMAIN, sslcontext=None, *, session=None, timeout=None, max_time=None
+    ):
         """Initialize the geocoder.
 
         Args:
@@ -150,8 +155,16 @@ class OpenCageGeocodeUA:
             protocol (str, optional): The protocol to use for requests ('http' or 'https'). Defaults to 'https'.
             domain (str, optional): The domain for the OpenCage API. Defaults to DEFAULT_DOMAIN.
             sslcontext: The SSL context to use for secure requests. Defaults to None.
+            session (aiohttp.ClientSession, optional): A shared session for the async methods. It is
+                used instead of a new session per context and is not closed on exit. Defaults to None.
+            timeout (float, optional): Seconds one async request may take. Defaults to DEFAULT_TIMEOUT.
+            max_time (float, optional): Seconds after which failed async requests are no longer retried.
+                Defaults to backoff_max_time().
         """
         self.key = key
+        self._shared_session = session
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.max_time = max_time
 
         if protocol and protocol not in ("http", "https"):
             protocol = "https"
@@ -176,12 +189,13 @@ class OpenCageGeocodeUA:
         if not AIOHTTP_AVAILABLE:
             raise AioHttpError("You must install `aiohttp` to use async methods")
 
-        self.session = aiohttp.ClientSession()
+        self.session = self._shared_session or aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, *args):
-        """Asynchronously exits the runtime context, closing the aiohttp session."""
-        await self.session.close()
+        """Asynchronously exits the runtime context, closing the aiohttp session unless it is shared."""
+        if self.session is not self._shared_session:
+            await self.session.close()
         self.session = None
         return False
 
@@ -279,6 +293,84 @@ class OpenCageGeocodeUA:
         """Get licenses."""
         return await self._licenses_async(_query_for_reverse_geocoding(lat, lng), **kwargs)
 
+    async def reverse_geocode_with_licenses_async(self, lat, lng, **kwargs):
+        """Reverse geocode a latitude & longitude and return results and licenses of the same response.
+
+        :param lat: Latitude
+        :param lng: Longitude
+        :return: Results and licenses from OpenCageData
+        :rtype: tuple
+        :raises RateLimitExceededError: if exceeded number of queries you can make. You can try again
+        :raises UnknownError: if something goes wrong with the OpenCage API
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise AioHttpError("You must install `aiohttp` to use async methods.")
+
+        if not self.session:
+            raise AioHttpError("Async methods must be used inside an async context.")
+
+        if not isinstance(self.session, aiohttp.client.ClientSession):
+            raise AioHttpError("You must use `reverse_geocode_with_licenses_async` in an async context.")
+
+        request = self._parse_request(_query_for_reverse_geocoding(lat, lng), kwargs)
+        response = await self._opencage_async_request(request)
+
+        return floatify_latlng(response["results"]), response.get("licenses", [])
+
+    async def reverse_geocode_batch_async(
+        self, coordinates, queue=None, concurrency=DEFAULT_BATCH_CONCURRENCY, **kwargs
+    ):
+        """Reverse geocode many latitude & longitude pairs over the session of this context.
+
+        At most `concurrency` pairs are looked up at the same time. With a `queue`,
+        every request runs in turn through its `async_run`, so the batch shares the
+        pacing, rate limit and circuit breaker of the single lookups: a rate limit
+        pauses the queue, and the outcome of each request is recorded on it. Once
+        the rate limit is exceeded, the remaining pairs are not sent and get an error.
+
+        :param coordinates: List of (latitude, longitude) pairs
+        :param queue: Optional queue with `async_run`, `pause`, `record_success`
+            and `record_failure` that paces the requests
+        :param concurrency: Maximum number of pairs looked up at the same time
+        :return: Per pair in the same order, the results and licenses as returned by
+            `reverse_geocode_with_licenses_async` or the error of its lookup
+        :rtype: list
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        rate_limit = None
+
+        async def _request(lat, lng):
+            nonlocal rate_limit
+            if rate_limit is not None:
+                raise rate_limit
+            try:
+                response = await self.reverse_geocode_with_licenses_async(lat, lng, **kwargs)
+            except RateLimitExceededError as exp:
+                rate_limit = exp
+                if queue is not None:
+                    queue.pause(exp.reset_time)
+                raise
+            except (OpenCageGeocodeError, aiohttp.ClientError, asyncio.TimeoutError):
+                if queue is not None:
+                    queue.record_failure()
+                raise
+            if queue is not None:
+                queue.record_success()
+            return response
+
+        async def _reverse_geocode(lat, lng):
+            async with semaphore:
+                try:
+                    if queue is None:
+                        return await _request(lat, lng)
+                    return await queue.async_run(
+                        ("batch", lat, lng, kwargs.get("language")), lambda: _request(lat, lng)
+                    )
+                except Exception as exp:  # noqa: BLE001
+                    return exp
+
+        return list(await asyncio.gather(*(_reverse_geocode(lat, lng) for lat, lng in coordinates)))
+
     @backoff.on_exception(
         backoff.expo, (UnknownError, requests.exceptions.RequestException), max_tries=5, max_time=backoff_max_time
     )
@@ -330,8 +422,24 @@ class OpenCageGeocodeUA:
         }
 
     async def _opencage_async_request(self, params):
+        """Send a request, retrying server and network errors with jittered exponential backoff."""
+        retry = backoff.on_exception(
+            backoff.expo,
+            (UnknownError, aiohttp.ClientError, asyncio.TimeoutError),
+            max_tries=DEFAULT_MAX_TRIES,
+            max_time=self.max_time if self.max_time is not None else backoff_max_time(),
+            giveup=lambda exp: isinstance(exp, aiohttp.ContentTypeError),
+        )
+        return await retry(self._opencage_async_request_once)(params)
+
+    async def _opencage_async_request_once(self, params):
         try:
-            async with self.session.get(self.url, params=params, ssl=self.sslcontext) as response:
+            async with self.session.get(
+                self.url, params=params, ssl=self.sslcontext, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if response.status >= 500:
+                    raise UnknownError(f"{response.status} status code from API")
+
                 try:
                     response_json = await response.json()
                 except ValueError as excinfo:
@@ -350,9 +458,6 @@ class OpenCageGeocodeUA:
 
                     raise RateLimitExceededError(reset_to=int(response_json["rate"]["limit"]), reset_time=reset_time)
 
-                if response.status == 500:
-                    raise UnknownError("500 status code from API")
-
                 if "results" not in response_json:
                     raise UnknownError("JSON from API doesn't have a 'results' key")
 
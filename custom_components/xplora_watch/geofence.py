@@ -0,0 +1,59 @@
+"""Geofence for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from .const import GEOFENCE_HYSTERESIS, GEOFENCE_MAX_ACCURACY
+from .zone_index import Zone
+
+
+@dataclass(frozen=True, slots=True)
+class GeofenceTransition:
+    """A watch entered or left a zone."""
+
+    zone: Zone
+    entered: bool
+    distance: int
+
+
+class Geofence:
+    """Zone membership of one watch, kept across updates.
+
+    A position enters a zone once it is inside the radius. It only leaves the
+    zone once it is farther out than the radius plus the larger of the
+    hysteresis and the accuracy of the fix, so a watch waiting at the border
+    does not flap. Fixes less accurate than ``max_accuracy`` are ignored. The
+    first update only records the membership without transitions.
+    """
+
+    def __init__(self, hysteresis: int = GEOFENCE_HYSTERESIS, max_accuracy: int = GEOFENCE_MAX_ACCURACY) -> None:
+        """Initialize an empty membership."""
+        self.hysteresis = hysteresis
+        self.max_accuracy = max_accuracy
+        self.inside: set[str] = set()
+        self._initialized = False
+
+    def update(self, zones: Mapping[str, Zone], distances: Mapping[str, int], accuracy: int = -1) -> list[GeofenceTransition]:
+        """Check a fix given as distance to each zone and return the transitions it caused."""
+        if accuracy > self.max_accuracy:
+            return []
+        margin = max(self.hysteresis, accuracy)
+        transitions: list[GeofenceTransition] = []
+        for zone_id in self.inside - zones.keys():
+            self.inside.discard(zone_id)
+        for zone_id, zone in zones.items():
+            if (distance := distances.get(zone_id)) is None:
+                continue
+            if zone_id in self.inside:
+                if distance > zone.radius + margin:
+                    self.inside.discard(zone_id)
+                    transitions.append(GeofenceTransition(zone, False, distance))
+            elif distance <= zone.radius:
+                self.inside.add(zone_id)
+                transitions.append(GeofenceTransition(zone, True, distance))
+        if not self._initialized:
+            self._initialized = True
+            return []
+        return transitions
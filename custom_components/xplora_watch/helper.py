@@ -6,15 +6,15 @@ import base64
 import json
 import logging
 import os
+from pathlib import Path
 import shutil
+import tempfile
 from typing import Any
 
 import aiofiles
-from geopy import distance
-from pydub import AudioSegment
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, CONF_LANGUAGE
+from homeassistant.const import CONF_LANGUAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import DATA_CUSTOM_COMPONENTS
@@ -29,54 +29,42 @@ from .const import (
     ATTR_SERVICE_SHUTDOWN,
     DEFAULT_LANGUAGE,
     DOMAIN,
-    HOME,
+    MEDIA_DECODE_CHUNK_SIZE,
 )
 from .coordinator import XploraDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_location_distance_meter(hass: HomeAssistant, lat_lng: tuple[float, float]) -> int:
-    """Get the distance in meters between two lat / lng points."""
-    home_zone = hass.states.get(HOME).attributes
-    return int(
-        distance.distance(
-            (home_zone[ATTR_LATITUDE], home_zone[ATTR_LONGITUDE]),
-            lat_lng,
-        ).m
-    )
-
-
-def is_distance_in_radius(home_lat_lng: tuple[float, float], lat_lng: tuple[float, float], radius: int) -> bool:
-    """Checks if distance is within radius of home."""
-    if radius >= int(distance.distance(home_lat_lng, lat_lng).m):
-        return True
-    return False
+def write_base64_to_file(base64_string: str, path: str) -> None:
+    """Decode a base64 string in chunks into a temporary file and rename it to path once complete."""
+    directory, name = os.path.split(path)
+    # Any whitespace, not only line breaks, would shift the chunks off the 4 character boundaries.
+    base64_string = "".join(base64_string.split())
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=f".{name}.", delete=False) as temp_file:
+        try:
+            for start in range(0, len(base64_string), MEDIA_DECODE_CHUNK_SIZE):
+                temp_file.write(base64.b64decode(base64_string[start : start + MEDIA_DECODE_CHUNK_SIZE]))
+        except BaseException:
+            temp_file.close()
+            os.remove(temp_file.name)
+            raise
+    Path(temp_file.name).replace(path)
 
 
 def encoded_base64_string_to_file(hass: HomeAssistant, base64_string: str, file_name: str, file_type: str, file_dir: str):
     """Convert base64 encoded string to file."""
     media_path = hass.config.path(f"www/{file_dir}")
-    if not os.path.exists(f"{media_path}/{file_name}.{file_type}"):
-        try:
-            decoded_data = base64.b64decode(base64_string.encode())
-            with open(f"{media_path}/{file_name}.{file_type}", "wb") as f:
-                f.write(decoded_data)
-        except AttributeError:
-            return
-
-
-def encoded_base64_string_to_mp3_file(hass: HomeAssistant, base64_string: str, file_name: str):
-    """Convert base64 encoded string to mp3 file."""
-    media_path = hass.config.path("www/voice")
-    if not os.path.exists(f"{media_path}/{file_name}.mp3"):
-        decoded_data = base64.b64decode(base64_string.encode())
-        with open(f"{media_path}/{file_name}.amr", "wb") as f:
-            f.write(decoded_data)
-        if os.path.exists(f"{media_path}/{file_name}.amr"):
-            sound = AudioSegment.from_file(f"{media_path}/{file_name}.amr", format="amr")
-            sound.export(f"{media_path}/{file_name}.mp3", format="mp3")
-            os.remove(f"{media_path}/{file_name}.amr")
+    if not isinstance(base64_string, str) or os.path.exists(f"{media_path}/{file_name}.{file_type}"):
+        return
+    write_base64_to_file(base64_string, f"{media_path}/{file_name}.{file_type}")
+
+
+async def async_encoded_base64_string_to_file(
+    hass: HomeAssistant, base64_string: str, file_name: str, file_type: str, file_dir: str
+) -> None:
+    """Convert base64 encoded string to file in the executor."""
+    await hass.async_add_executor_job(encoded_base64_string_to_file, hass, base64_string, file_name, file_type, file_dir)
 
 
 async def create_www_directory(hass: HomeAssistant):
@@ -0,0 +1,292 @@
+"""Location history for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from array import array
+import logging
+from pathlib import Path
+import struct
+import sys
+from typing import Any
+
+from pyxplora_api.status import LocationType
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import HISTORY_SAVE_DELAY, MOVEMENT_THRESHOLD
+from .offline_geocoder import haversine_meter
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAGIC = b"XWLH"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBI")
+_WATCH = struct.Struct("<HIIIddddd")
+_LOCATE_TYPES: tuple[str, ...] = tuple(locate_type.value for locate_type in LocationType)
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: bytes) -> array:
+    values = array(typecode, data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class LocationHistory:
+    """Ring buffer of the last fixes of one watch in typed arrays.
+
+    Each append also updates the distance travelled on the day of the fix, the
+    speed since the previous fix and the time the watch last moved, so the
+    derived sensors never have to scan the buffer. A move only counts once the
+    watch is farther than the movement threshold or the accuracy of the fix
+    from where it last moved, which keeps position jitter out of the distance.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty buffer."""
+        self.capacity = max(capacity, 1)
+        self._timestamps = array("d", bytes(8 * self.capacity))
+        self._lats = array("d", bytes(8 * self.capacity))
+        self._lngs = array("d", bytes(8 * self.capacity))
+        self._accuracies = array("f", bytes(4 * self.capacity))
+        self._locate_types = array("B", bytes(self.capacity))
+        self._start = 0
+        self.size = 0
+        self.day = 0
+        self.distance_today = 0.0
+        self.last_moved = 0.0
+        self.speed = 0.0
+        self._anchor = (0.0, 0.0)
+
+    def _index(self, position: int) -> int:
+        return (self._start + position) % self.capacity
+
+    def last(self) -> tuple[float, float, float, float, str] | None:
+        """Return timestamp, latitude, longitude, accuracy and locate type of the newest fix."""
+        if not self.size:
+            return None
+        return self.fix(self.size - 1)
+
+    def fix(self, position: int) -> tuple[float, float, float, float, str]:
+        """Return a fix by position, 0 is the oldest one."""
+        index = self._index(position)
+        return (
+            self._timestamps[index],
+            self._lats[index],
+            self._lngs[index],
+            self._accuracies[index],
+            _LOCATE_TYPES[self._locate_types[index]],
+        )
+
+    def _bisect(self, timestamp: float, inclusive: bool) -> int:
+        """Return the position of the first fix after a timestamp, or at it unless inclusive."""
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            value = self._timestamps[self._index(middle)]
+            if value < timestamp or (inclusive and value == timestamp):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def between(self, start: float, end: float) -> list[tuple[float, float, float, float, str]]:
+        """Return the fixes from start up to and including end, oldest first."""
+        return [self.fix(position) for position in range(self._bisect(start, False), self._bisect(end, True))]
+
+    def append(self, timestamp: float, lat: float, lng: float, accuracy: float, *, locate_type: str, day: int) -> bool:
+        """Add a fix of the given local day ordinal, False if it is not newer than the newest one."""
+        if (last := self.last()) is not None and timestamp <= last[0]:
+            return False
+        if last is None:
+            self._anchor = (lat, lng)
+            self.last_moved = timestamp
+            self.speed = 0.0
+        else:
+            seconds = timestamp - last[0]
+            self.speed = haversine_meter(last[1], last[2], lat, lng) / seconds * 3.6
+            moved = haversine_meter(self._anchor[0], self._anchor[1], lat, lng)
+            if day != self.day:
+                self.distance_today = 0.0
+            if moved > max(MOVEMENT_THRESHOLD, accuracy):
+                self.distance_today += moved
+                self.last_moved = timestamp
+                self._anchor = (lat, lng)
+            else:
+                self.speed = 0.0
+        self.day = day
+
+        if self.size < self.capacity:
+            index = self._index(self.size)
+            self.size += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._timestamps[index] = timestamp
+        self._lats[index] = lat
+        self._lngs[index] = lng
+        self._accuracies[index] = max(accuracy, -1)
+        self._locate_types[index] = _LOCATE_TYPES.index(locate_type) if locate_type in _LOCATE_TYPES else 0
+        return True
+
+    def distance_on(self, day: int) -> int:
+        """Return the meters travelled on a local day ordinal, 0 unless it is the day of the newest fix."""
+        return int(self.distance_today) if day == self.day else 0
+
+    def _ordered(self, values: array) -> array:
+        end = self._start + self.size
+        if end <= self.capacity:
+            return values[self._start : end]
+        return values[self._start :] + values[: end - self.capacity]
+
+    def to_bytes(self, wuid: str) -> bytes:
+        """Serialize the buffer and its running values, oldest fix first."""
+        key = wuid.encode()
+        return b"".join(
+            (
+                _WATCH.pack(
+                    len(key),
+                    self.capacity,
+                    self.size,
+                    self.day,
+                    self.distance_today,
+                    self.last_moved,
+                    self.speed,
+                    *self._anchor,
+                ),
+                key,
+                _to_bytes(self._ordered(self._timestamps)),
+                _to_bytes(self._ordered(self._lats)),
+                _to_bytes(self._ordered(self._lngs)),
+                _to_bytes(self._ordered(self._accuracies)),
+                self._ordered(self._locate_types).tobytes(),
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: memoryview, offset: int, capacity: int) -> tuple[str, LocationHistory, int]:
+        """Read one serialized buffer into a buffer of the given capacity, keeping the newest fixes."""
+        key_size, _, size, day, distance_today, last_moved, speed, anchor_lat, anchor_lng = _WATCH.unpack_from(data, offset)
+        offset += _WATCH.size
+        wuid = bytes(data[offset : offset + key_size]).decode()
+        offset += key_size
+        columns: list[array] = []
+        for typecode, item_size in (("d", 8), ("d", 8), ("d", 8), ("f", 4), ("B", 1)):
+            columns.append(_from_bytes(typecode, bytes(data[offset : offset + size * item_size])))
+            offset += size * item_size
+
+        history = cls(capacity)
+        keep = min(size, history.capacity)
+        for column, target in zip(
+            columns,
+            (history._timestamps, history._lats, history._lngs, history._accuracies, history._locate_types),
+            strict=True,
+        ):
+            target[:keep] = column[size - keep :]
+        history.size = keep
+        history.day = day
+        history.distance_today = distance_today
+        history.last_moved = last_moved
+        history.speed = speed
+        history._anchor = (anchor_lat, anchor_lng)
+        return wuid, history, offset
+
+
+class LocationHistoryStore:
+    """Location histories of all watches of a config entry, saved as one binary file in .storage."""
+
+    def __init__(self, hass: HomeAssistant, key: str, capacity: int) -> None:
+        """Initialize the store."""
+        self._hass = hass
+        self.path = Path(hass.config.path(STORAGE_DIR, key))
+        self.capacity = capacity
+        self.histories: dict[str, LocationHistory] = {}
+        self._unsub_save: CALLBACK_TYPE | None = None
+        self._unsub_final_write: CALLBACK_TYPE | None = None
+
+    def get(self, wuid: str) -> LocationHistory:
+        """Return the history of a watch."""
+        if wuid not in self.histories:
+            self.histories[wuid] = LocationHistory(self.capacity)
+        return self.histories[wuid]
+
+    def _read(self) -> bytes | None:
+        try:
+            return self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    async def async_load(self) -> None:
+        """Load the saved histories and save them again when Home Assistant stops."""
+        self._unsub_final_write = self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write)
+        data = await self._hass.async_add_executor_job(self._read)
+        if not data:
+            return
+        try:
+            magic, version, count = _HEADER.unpack_from(data)
+            if magic != _MAGIC or version != _VERSION:
+                _LOGGER.warning("Ignoring location history %s of unknown format", self.path)
+                return
+            view = memoryview(data)
+            offset = _HEADER.size
+            for _ in range(count):
+                wuid, history, offset = LocationHistory.from_bytes(view, offset, self.capacity)
+                self.histories[wuid] = history
+        except (struct.error, ValueError, UnicodeDecodeError) as error:
+            _LOGGER.warning("Ignoring damaged location history %s: %s", self.path, error)
+            self.histories.clear()
+            return
+        _LOGGER.debug("Loaded the location history of %s watches", len(self.histories))
+
+    def _data(self) -> bytes:
+        return b"".join(
+            (
+                _HEADER.pack(_MAGIC, _VERSION, len(self.histories)),
+                *(history.to_bytes(wuid) for wuid, history in self.histories.items()),
+            )
+        )
+
+    def _write(self, data: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_bytes(data)
+        temp_path.replace(self.path)
+
+    @callback
+    def async_delay_save(self) -> None:
+        """Save the histories after HISTORY_SAVE_DELAY seconds, merging the saves in between."""
+        if self._unsub_save is None:
+            self._unsub_save = async_call_later(self._hass, HISTORY_SAVE_DELAY, self._async_scheduled_save)
+
+    async def _async_scheduled_save(self, _: Any) -> None:
+        self._unsub_save = None
+        await self.async_save()
+
+    async def _async_final_write(self, _: Event) -> None:
+        self._unsub_final_write = None
+        await self.async_save()
+
+    async def async_save(self) -> None:
+        """Write the histories now."""
+        if self._unsub_save is not None:
+            self._unsub_save()
+            self._unsub_save = None
+        await self._hass.async_add_executor_job(self._write, self._data())
+
+    async def async_unload(self) -> None:
+        """Write pending changes and stop listening for Home Assistant to stop."""
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        if self._unsub_save is not None:
+            await self.async_save()
@@ -0,0 +1,46 @@
+"""Data models for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from pyxplora_api.status import LocationType
+
+
+@dataclass(frozen=True, slots=True)
+class WatchSnapshot:
+    """State of one watch as fetched by a single poll."""
+
+    watch_id: str
+    unread_msg: int = -1
+    battery: int | None = None
+    is_charging: bool | None = None
+    is_online: bool = False
+    is_safezone: bool = False
+    alarm: tuple[dict[str, Any], ...] = ()
+    silent: tuple[dict[str, Any], ...] = ()
+    safe_zones: tuple[dict[str, Any], ...] = ()
+    step_day: int | None = None
+    xcoin: int = 0
+    lat: float | None = None
+    lng: float | None = None
+    poi: str | None = None
+    location_name: str | None = None
+    licence: str | None = None
+    location_accuracy: int = -1
+    home_distance: int | None = None
+    in_home_safezone: bool | None = None
+    zone_distances: dict[str, int] = field(default_factory=dict)
+    in_zones: tuple[str, ...] = ()
+    speed: float | None = None
+    distance_today: int | None = None
+    last_moved: datetime | None = None
+    locate_type: str = LocationType.UNKNOWN.value
+    last_track_time: str | None = None
+    imei: str = ""
+    entity_picture: str = ""
+    os_version: str = "n/a"
+    model: str = "GPS-Watch"
+    chats: dict[str, Any] = field(default_factory=dict)
@@ -0,0 +1,125 @@
+"""Offline reverse geocoding for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import math
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_OFFLINE_GEOCODERS, DOMAIN, OFFLINE_CELL_SIZE, OFFLINE_MAX_DISTANCE
+
+_LOGGER = logging.getLogger(__name__)
+
+EARTH_RADIUS: float = 6371008.8
+METER_PER_DEGREE: float = math.pi * EARTH_RADIUS / 180
+
+
+def haversine_meter(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Return the great circle distance between two positions in meters."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = math.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+@dataclass(frozen=True, slots=True)
+class Place:
+    """A named place of the gazetteer."""
+
+    name: str
+    lat: float
+    lng: float
+    country: str = ""
+
+
+class OfflineGeocoder:
+    """Nearest place lookup on a regular lat/lng grid.
+
+    Places are bucketed in cells of ``cell_size`` degrees. A lookup searches the
+    rings of cells around the position until no closer place can exist.
+    """
+
+    def __init__(self, cell_size: float = OFFLINE_CELL_SIZE) -> None:
+        """Initialize an empty index."""
+        self.cell_size = cell_size
+        self._grid: dict[tuple[int, int], list[Place]] = {}
+        self.size = 0
+
+    def _cell(self, lat: float, lng: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_size), math.floor(lng / self.cell_size)
+
+    def add(self, place: Place) -> None:
+        """Add a place to the index."""
+        self._grid.setdefault(self._cell(place.lat, place.lng), []).append(place)
+        self.size += 1
+
+    @classmethod
+    def from_file(cls, path: str, cell_size: float = OFFLINE_CELL_SIZE) -> OfflineGeocoder:
+        """Build an index from a GeoNames dump, e.g. cities1000.txt.
+
+        Each tab separated line holds the id, name, ascii name, alternate names,
+        latitude, longitude, feature class, feature code and country code. User
+        extracts only need the first six columns.
+        """
+        geocoder = cls(cell_size)
+        with open(path, encoding="utf-8") as dataset:
+            for line in dataset:
+                columns = line.rstrip("\n").split("\t")
+                if len(columns) < 6:
+                    continue
+                try:
+                    lat, lng = float(columns[4]), float(columns[5])
+                except ValueError:
+                    continue
+                geocoder.add(Place(columns[1], lat, lng, columns[8] if len(columns) > 8 else ""))
+        _LOGGER.debug("Loaded %s places from %s", geocoder.size, path)
+        return geocoder
+
+    def nearest(self, lat: float, lng: float, max_distance: float = OFFLINE_MAX_DISTANCE) -> tuple[Place, float] | None:
+        """Return the nearest place within max_distance meters and its distance."""
+        row, col = self._cell(lat, lng)
+        # A cell is narrowest along the longitude, use that as lower bound per ring.
+        cell_meter = self.cell_size * METER_PER_DEGREE * max(math.cos(math.radians(min(abs(lat) + 1, 89))), 1e-6)
+        max_ring = math.ceil(max_distance / cell_meter) + 1
+        best: tuple[Place, float] | None = None
+        for ring in range(max_ring + 1):
+            if best is not None and (ring - 1) * cell_meter > best[1]:
+                break
+            for cell in self._ring(row, col, ring):
+                for place in self._grid.get(cell, ()):
+                    meter = haversine_meter(lat, lng, place.lat, place.lng)
+                    if meter <= max_distance and (best is None or meter < best[1]):
+                        best = (place, meter)
+        return best
+
+    @staticmethod
+    def _ring(row: int, col: int, ring: int) -> list[tuple[int, int]]:
+        if ring == 0:
+            return [(row, col)]
+        cells = [(row - ring, c) for c in range(col - ring, col + ring + 1)]
+        cells += [(row + ring, c) for c in range(col - ring, col + ring + 1)]
+        cells += [(r, col - ring) for r in range(row - ring + 1, row + ring)]
+        cells += [(r, col + ring) for r in range(row - ring + 1, row + ring)]
+        return cells
+
+    def reverse_geocode(self, lat: float, lng: float) -> str | None:
+        """Return the name of the nearest place, with its country code."""
+        if (found := self.nearest(lat, lng)) is None:
+            return None
+        place = found[0]
+        return f"{place.name}, {place.country}" if place.country else place.name
+
+
+async def async_get_offline_geocoder(hass: HomeAssistant, path: str) -> OfflineGeocoder | None:
+    """Return the index of a dataset, loading it once for all config entries."""
+    geocoders: dict[str, OfflineGeocoder] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_OFFLINE_GEOCODERS, {})
+    path = hass.config.path(path)
+    if path not in geocoders:
+        try:
+            geocoders[path] = await hass.async_add_executor_job(OfflineGeocoder.from_file, path)
+        except OSError as error:
+            _LOGGER.error("Unable to load the offline geocoding dataset %s: %s", path, error)
+            return None
+    return geocoders[path]
@@ -0,0 +1,61 @@
+"""Adaptive polling for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from geopy import distance
+
+from .const import LOW_BATTERY_LEVEL, MOVEMENT_THRESHOLD
+from .models import WatchSnapshot
+
+
+def moved_distance_meter(previous: WatchSnapshot | None, current: WatchSnapshot) -> int | None:
+    """Return how far a watch moved between two snapshots, None if unknown."""
+    if previous is None or None in (previous.lat, previous.lng, current.lat, current.lng):
+        return None
+    return int(distance.distance((previous.lat, previous.lng), (current.lat, current.lng)).m)
+
+
+class AdaptivePollScheduler:
+    """Choose the next poll interval of a watch from its last two snapshots.
+
+    A watch that moves outside of its safe zones is polled with the minimum
+    interval. A watch that is offline, charging, resting inside a safe zone or no
+    longer reporting new positions is polled with the maximum interval. Everything else uses the configured scan
+    interval, doubled while the battery is low.
+    """
+
+    def __init__(self, scan_interval: int, min_interval: int, max_interval: int) -> None:
+        """Initialize the scheduler with intervals in seconds."""
+        self.min_interval = max(min(min_interval, max_interval), 1)
+        self.max_interval = max(min_interval, max_interval, 1)
+        self.scan_interval = self._clamp(scan_interval)
+
+    def _clamp(self, seconds: int) -> int:
+        return min(max(int(seconds), self.min_interval), self.max_interval)
+
+    def next_seconds(self, previous: WatchSnapshot | None, current: WatchSnapshot) -> int:
+        """Return the number of seconds until the next poll."""
+        if not current.is_online or current.is_charging:
+            return self.max_interval
+
+        moved = moved_distance_meter(previous, current)
+        is_moving = moved is not None and moved >= MOVEMENT_THRESHOLD
+        # is_safezone is True while the watch is outside of all of its safe zones.
+        if is_moving and current.is_safezone:
+            return self.min_interval
+
+        is_resting = moved is not None and not is_moving
+        has_new_fix = previous is None or previous.last_track_time != current.last_track_time
+        if is_resting and (not current.is_safezone or not has_new_fix):
+            return self.max_interval
+
+        seconds = self.scan_interval
+        if current.battery is not None and current.battery <= LOW_BATTERY_LEVEL:
+            seconds *= 2
+        return self._clamp(seconds)
+
+    def next_interval(self, previous: WatchSnapshot | None, current: WatchSnapshot) -> timedelta:
+        """Return the time until the next poll."""
+        return timedelta(seconds=self.next_seconds(previous, current))
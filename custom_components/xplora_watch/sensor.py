@@ -2,32 +2,33 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorEntityDescription, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ID, CONF_NAME, PERCENTAGE, EntityCategory, UnitOfLength
+from homeassistant.const import ATTR_ID, CONF_NAME, PERCENTAGE, EntityCategory, UnitOfLength, UnitOfSpeed
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
 from .const import (
-    ATTR_TRACKER_LAT,
-    ATTR_TRACKER_LNG,
     ATTR_WATCH,
     CONF_TYPES,
     CONF_WATCHES,
     DOMAIN,
     SENSOR_BATTERY,
     SENSOR_DISTANCE,
+    SENSOR_DISTANCE_TODAY,
+    SENSOR_LAST_MOVED,
     SENSOR_MESSAGE,
+    SENSOR_SPEED,
     SENSOR_STEP_DAY,
     SENSOR_XCOIN,
 )
-from .coordinator import XploraDataUpdateCoordinator
+from .coordinator import XploraDataUpdateCoordinator, XploraWatchCoordinator
 from .entity import XploraBaseEntity
-from .helper import get_location_distance_meter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +64,24 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
+    SensorEntityDescription(
+        key=SENSOR_SPEED,
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        device_class=SensorDeviceClass.SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_DISTANCE_TODAY,
+        icon="mdi:map-marker-distance",
+        native_unit_of_measurement=UnitOfLength.METERS,
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_LAST_MOVED,
+        icon="mdi:map-marker-check",
+        device_class=SensorDeviceClass.TIMESTAMP,
+    ),
 )
 
 
@@ -91,7 +110,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
             if conf_watches is None or conf_tyes is None or wuid not in conf_watches or description.key not in conf_tyes:
                 continue
 
-            entities.append(XploraSensor(config_entry, coordinator, ward, wuid, description))
+            entities.append(XploraSensor(config_entry, coordinator.watch_coordinators[wuid], ward, wuid, description))
 
     async_add_entities(entities)
 
@@ -102,14 +121,14 @@ class XploraSensor(XploraBaseEntity, SensorEntity):
     def __init__(
         self,
         config_entry: ConfigEntry,
-        coordinator: XploraDataUpdateCoordinator,
+        coordinator: XploraWatchCoordinator,
         ward: dict[str, Any],
         wuid: str,
         description: SensorEntityDescription,
     ) -> None:
         """Initialize a sensor for an Xplora® Watch."""
         super().__init__(config_entry, description, coordinator, wuid)
-        if self.watch_uid not in self.coordinator.data:
+        if self.coordinator.data is None:
             return
 
         self._attr_name: str = f"{ward.get(CONF_NAME)} {ATTR_WATCH} {description.key} ({coordinator.username})".replace(
@@ -124,35 +143,31 @@ class XploraSensor(XploraBaseEntity, SensorEntity):
         _LOGGER.debug("Updating sensor: %s | Typ: %s | Watch_ID ...%s", self._attr_name, description.key, wuid[25:])
 
     @property
-    def native_value(self) -> StateType:
+    def native_value(self) -> StateType | datetime:
         """Return the state of the sensor."""
+        snapshot = self.coordinator.data
         if self.entity_description.key == SENSOR_BATTERY:
-            return self.coordinator.data[self.watch_uid].get(SENSOR_BATTERY, None)
+            return snapshot.battery
         if self.entity_description.key == SENSOR_STEP_DAY:
-            return self.coordinator.data[self.watch_uid].get(SENSOR_STEP_DAY, 0)
+            return snapshot.step_day
         if self.entity_description.key == SENSOR_XCOIN:
-            return self.coordinator.data[self.watch_uid].get(SENSOR_XCOIN, 0)
+            return snapshot.xcoin
         if self.entity_description.key == SENSOR_MESSAGE:
-            return self.coordinator.data[self.watch_uid].get("unreadMsg", 0)
+            return snapshot.unread_msg
         if self.entity_description.key == SENSOR_DISTANCE:
-            lat = self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LAT, None)
-            lng = self.coordinator.data[self.watch_uid].get(ATTR_TRACKER_LNG, None)
-            if lat and lng:
-                lat_lng: tuple[float, float] = (float(lat), float(lng))
-                return get_location_distance_meter(self.hass, lat_lng)
-            return -1
+            return snapshot.home_distance if snapshot.home_distance is not None else -1
+        if self.entity_description.key == SENSOR_SPEED:
+            return snapshot.speed
+        if self.entity_description.key == SENSOR_DISTANCE_TODAY:
+            return snapshot.distance_today
+        if self.entity_description.key == SENSOR_LAST_MOVED:
+            return snapshot.last_moved
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return state attributes that should be added to SENSOR_STATE."""
         data = super().extra_state_attributes or {}
-        if (
-            self.entity_description.key is SENSOR_MESSAGE
-            and self.coordinator.data
-            and self.coordinator.data.get(self.watch_uid, None)
-            and SENSOR_MESSAGE in self.coordinator.data[self.watch_uid]
-            and self.coordinator.data[self.watch_uid].get(SENSOR_MESSAGE, None)
-        ):
-            return dict(data, **self.coordinator.data[self.watch_uid].get(SENSOR_MESSAGE))
+        if self.entity_description.key is SENSOR_MESSAGE and self.coordinator.data and self.coordinator.data.chats:
+            return dict(data, **self.coordinator.data.chats)
         return dict(data, user=self.coordinator.controller.getUserName())
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from pyxplora_api.exception_classes import NoAdminError
 import voluptuous as vol
@@ -24,10 +23,10 @@ from .const import (
     CONF_MESSAGE,
     CONF_REMOVE_MESSAGE,
     DOMAIN,
-    SENSOR_MESSAGE,
 )
 from .coordinator import XploraDataUpdateCoordinator
-from .helper import encoded_base64_string_to_file, encoded_base64_string_to_mp3_file
+from .helper import async_encoded_base64_string_to_file
+from .transcoder import get_transcoder
 
 BASE_SHUTDOWN_SERVICE_SCHEMA = vol.Schema(
     {
@@ -165,6 +164,8 @@ class XploraDeleteMessageFromAppService(XploraService):
                     _LOGGER.debug("remove message %s from %s", msg_id, watch_id)
                     if not await coordinator.controller.deleteMessageFromApp(wuid=watch_id, msgId=msg_id):
                         _LOGGER.error("Message cannot deleted!")
+                    else:
+                        await coordinator.chat_sync.async_invalidate(watch_id)
         else:
             _LOGGER.warning("No watch id or type %s not allow!", type(targets))
 
@@ -203,7 +204,6 @@ class XploraMessageSensorUpdateService(XploraService):
         if not isinstance(targets, list):
             _LOGGER.warning("No watch id or type %s not allowed!", type(targets))
             return
-        old_state: dict[str, Any] = self.coordinator.data
         options = self.coordinator.config_entry.options
         limit: int = options.get(CONF_MESSAGE, 10)
         show_remove_msg = options.get(CONF_REMOVE_MESSAGE, False)
@@ -221,29 +221,30 @@ class XploraMessageSensorUpdateService(XploraService):
                         await self._fetch_chat_short_video(watch, msg_id)
                     elif chat_type == "IMAGE":
                         await self._fetch_chat_image(watch, msg_id)
-                new_data_msg: dict[str, Any] = old_state.get(watch, {}) if isinstance(old_state, dict) else {}
-                if new_data_msg:
-                    new_data_msg.update({SENSOR_MESSAGE: res_chats})
-                    old_state.update({watch: new_data_msg})
-        await self.coordinator.async_update_xplora_data(new_data=old_state)
+        new_data = {watch: self.coordinator.data[watch] for watch in targets if watch in self.coordinator.data}
+        await self.coordinator.async_update_xplora_data(new_data=new_data)
 
     async def _fetch_chat_voice(self, watch_id: str, msg_id: str) -> None:
+        transcoder = get_transcoder(self._hass)
+        if transcoder.is_pending(msg_id):
+            return
         voice = await self.coordinator.controller.get_chat_voice(watch_id, msg_id)
         if voice:
-            encoded_base64_string_to_mp3_file(self._hass, voice, msg_id)
+            # Converted in the background, the service call does not wait for the MP3 files.
+            transcoder.async_submit(msg_id, voice)
 
     async def _fetch_chat_short_video(self, watch_id: str, msg_id: str) -> None:
         video = await self.coordinator.controller.get_short_video(watch_id, msg_id)
         if video:
-            encoded_base64_string_to_file(self._hass, video, msg_id, "mp4", "video")
+            await async_encoded_base64_string_to_file(self._hass, video, msg_id, "mp4", "video")
         thumb = await self.coordinator.controller.get_short_video_cover(watch_id, msg_id)
         if thumb:
-            encoded_base64_string_to_file(self._hass, thumb, msg_id, "jpeg", "video/thumb")
+            await async_encoded_base64_string_to_file(self._hass, thumb, msg_id, "jpeg", "video/thumb")
 
     async def _fetch_chat_image(self, watch, msg_id):
         image = await self.coordinator.controller.get_chat_image(watch, msg_id)
         if image:
-            encoded_base64_string_to_file(self._hass, image, msg_id, "jpeg", "image")
+            await async_encoded_base64_string_to_file(self._hass, image, msg_id, "jpeg", "image")
 
 
 class XploraShutdownService(XploraService):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 import logging
 from typing import Any
 
@@ -25,7 +26,7 @@ from .const import (
     SWITCH_ALARM,
     SWITCH_SILENT,
 )
-from .coordinator import XploraDataUpdateCoordinator
+from .coordinator import XploraDataUpdateCoordinator, XploraWatchCoordinator
 from .entity import XploraBaseEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -75,12 +76,13 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
             ):
                 continue
 
+            watch_coordinator = coordinator.watch_coordinators[wuid]
             if description.key == SWITCH_ALARM:
                 for alarm in await coordinator.controller.getWatchAlarm(wuid):
-                    entities.append(XploraAlarmSwitch(config_entry, alarm, coordinator, ward, wuid, description))
+                    entities.append(XploraAlarmSwitch(config_entry, alarm, watch_coordinator, ward, wuid, description))
             if description.key == SWITCH_SILENT:
                 for silent in await coordinator.controller.getSilentTime(wuid):
-                    entities.append(XploraSilentSwitch(config_entry, silent, coordinator, ward, wuid, description))
+                    entities.append(XploraSilentSwitch(config_entry, silent, watch_coordinator, ward, wuid, description))
 
     async_add_entities(entities, True)
 
@@ -92,14 +94,14 @@ class XploraAlarmSwitch(XploraBaseEntity, SwitchEntity):
         self,
         config_entry: ConfigEntry,
         alarm: dict[str, Any],
-        coordinator: XploraDataUpdateCoordinator,
+        coordinator: XploraWatchCoordinator,
         ward: dict[str, Any],
         wuid: str,
         description: SwitchEntityDescription,
     ) -> None:
         """Initialize alarm switch."""
         super().__init__(config_entry, description, coordinator, wuid)
-        if self.watch_uid not in self.coordinator.data:
+        if self.coordinator.data is None:
             return
 
         self._alarm = alarm
@@ -132,15 +134,14 @@ class XploraAlarmSwitch(XploraBaseEntity, SwitchEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.coordinator.data[self.watch_uid] = self.coordinator.data[self.watch_uid]
-        for alarm in self.coordinator.data[self.watch_uid].get("alarm", []):
+        for alarm in self.coordinator.data.alarm:
             if alarm[ATTR_ID] == self._alarm[ATTR_ID]:
                 self._attr_is_on = self._states(alarm["status"])
                 self.async_write_ha_state()
         super()._handle_coordinator_update()
 
     async def _set_turn_on_off(self, status: bool) -> None:
-        controller: PyXploraApi = self.hass.data[DOMAIN][self.entity_id].controller  # self.coordinator.controller
+        controller: PyXploraApi = self.coordinator.controller
         if status:
             alarms = await controller.setEnableAlarmTime(alarm_id=self._alarm[ATTR_ID])
         else:
@@ -148,9 +149,8 @@ class XploraAlarmSwitch(XploraBaseEntity, SwitchEntity):
         if alarms:
             self._attr_is_on = status
 
-        data = self.coordinator.data
-        data[self.watch_uid]["alarm"] = await self.coordinator.controller.getWatchAlarm(self.watch_uid)
-        self.coordinator.data = data
+        watch_alarms = await self.coordinator.controller.getWatchAlarm(self.watch_uid)
+        self.coordinator.account.async_publish({self.watch_uid: replace(self.coordinator.data, alarm=tuple(watch_alarms))})
         self.async_write_ha_state()
         await self.coordinator.async_refresh()
 
@@ -188,16 +188,15 @@ class XploraSilentSwitch(XploraBaseEntity, SwitchEntity):
         self,
         config_entry: ConfigEntry,
         silent: dict[str, Any],
-        coordinator: XploraDataUpdateCoordinator,
+        coordinator: XploraWatchCoordinator,
         ward: dict[str, Any],
         wuid: str,
         description: SwitchEntityDescription,
     ) -> None:
         """Initialize silent switch."""
         super().__init__(config_entry, description, coordinator, wuid)
-        if self.watch_uid not in self.coordinator.data:
+        if self.coordinator.data is None:
             return
-        self.coordinator.data[self.watch_uid]: dict[str, Any] = self.coordinator.data[self.watch_uid]
 
         self._silent = silent
 
@@ -227,8 +226,7 @@ class XploraSilentSwitch(XploraBaseEntity, SwitchEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.coordinator.data[self.watch_uid] = self.coordinator.data[self.watch_uid]
-        for silent in self.coordinator.data[self.watch_uid].get("silent", []):
+        for silent in self.coordinator.data.silent:
             if silent[ATTR_ID] == self._silent[ATTR_ID]:
                 self._attr_is_on = self._states(silent["status"])
                 self.async_write_ha_state()
@@ -244,9 +242,8 @@ class XploraSilentSwitch(XploraBaseEntity, SwitchEntity):
         if silents:
             self._attr_is_on = status
 
-        data = self.coordinator.data
-        data[self.watch_uid]["silent"] = await self.coordinator.controller.getSilentTime(self.watch_uid)
-        self.coordinator.data = data
+        silent_times = await self.coordinator.controller.getSilentTime(self.watch_uid)
+        self.coordinator.account.async_publish({self.watch_uid: replace(self.coordinator.data, silent=tuple(silent_times))})
         self.async_write_ha_state()
         await self.coordinator.async_refresh()
 
@@ -0,0 +1,171 @@
+"""Session and token lifecycle for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any
+
+import aiohttp
+from pyxplora_api.exception_classes import Error
+from pyxplora_api.pyxplora_api_async import PyXploraApi
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_COUNTRY_CODE, CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import aiohttp_client
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_PHONENUMBER, CONF_TIMEZONE, CONF_USERLANG, CONF_WATCHES, DEFAULT_TOKEN_LIFETIME, TOKEN_REFRESH_MARGIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _parse_expire_date(value: Any) -> datetime | None:
+    """Convert the expireDate of an issue token into an aware datetime."""
+    if isinstance(value, (int, float)) and value > 0:
+        # The API reports epoch seconds, some backends milliseconds.
+        timestamp = value / 1000 if value > 10**11 else value
+        return dt_util.utc_from_timestamp(timestamp)
+    if isinstance(value, str) and value:
+        if value.isdigit():
+            return _parse_expire_date(int(value))
+        return dt_util.parse_datetime(value)
+    return None
+
+
+class XploraTokenManager:
+    """Keep one logged in Xplora® controller alive for a config entry.
+
+    The token is refreshed shortly before it expires. A full login only happens
+    on the first call and when the API signals an authentication failure. The
+    account payload of the login, which holds XCoins and icons of the watches,
+    is reloaded separately because a token refresh does not renew it.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the token manager."""
+        self._hass = hass
+        self._entry = entry
+        self._lock = asyncio.Lock()
+        self._session: aiohttp.ClientSession | None = None
+        self._expires_at: datetime | None = None
+        self._user_updated = 0.0
+        self.controller: PyXploraApi | None = None
+        self.login_count = 0
+        self.refresh_count = 0
+
+    @property
+    def expires_at(self) -> datetime | None:
+        """Return when the current token expires."""
+        return self._expires_at
+
+    def _create_controller(self) -> PyXploraApi:
+        """Create a new controller from the config entry."""
+        data = self._entry.data
+        return PyXploraApi(
+            countrycode=data.get(CONF_COUNTRY_CODE),
+            phoneNumber=data.get(CONF_PHONENUMBER),
+            password=data[CONF_PASSWORD],
+            userLang=data[CONF_USERLANG],
+            timeZone=data[CONF_TIMEZONE],
+            wuid=self._entry.options.get(CONF_WATCHES),
+            email=data.get(CONF_EMAIL),
+            session=self._session,
+        )
+
+    def _issue_token(self) -> dict[str, Any]:
+        """Return the issue token of the current controller."""
+        if self.controller is None:
+            return {}
+        return self.controller._issueToken or {}  # noqa: SLF001
+
+    def _set_expiry(self, token: dict[str, Any]) -> None:
+        """Remember when the given token expires."""
+        expires_at = _parse_expire_date(token.get("expireDate"))
+        if expires_at is None:
+            expires_at = dt_util.utcnow() + timedelta(seconds=DEFAULT_TOKEN_LIFETIME)
+        self._expires_at = expires_at
+        _LOGGER.debug("Xplora® token valid until %s", expires_at)
+
+    async def async_login(self, session: aiohttp.ClientSession | None = None) -> PyXploraApi:
+        """Log in with a fresh controller."""
+        async with self._lock:
+            if session is not None:
+                self._session = session
+            await self._async_login()
+        return self.controller
+
+    async def _async_login(self) -> None:
+        if self._session is None:
+            self._session = aiohttp_client.async_get_clientsession(self._hass)
+        controller = self._create_controller()
+        await controller.init(forceLogin=True)
+        self.controller = controller
+        self.login_count += 1
+        self._user_updated = time.monotonic()
+        self._set_expiry(self._issue_token())
+
+    async def _async_refresh(self) -> bool:
+        """Refresh the token with the refresh token of the last login."""
+        wuids = self.controller.getWatchUserIDs()
+        if not wuids:
+            return False
+        try:
+            token = await self.controller.refresh_token(wuids[0])
+        except (Error, aiohttp.ClientError, TimeoutError) as error:
+            _LOGGER.debug("Refreshing the Xplora® token failed: %s", error)
+            return False
+        if not isinstance(token, dict) or not token.get("token") or token.get("valid") is False:
+            return False
+
+        handler = self.controller._gql_handler  # noqa: SLF001
+        handler.accessToken = token["token"]
+        handler.refreshToken = token.get("refreshToken") or handler.refreshToken
+        if handler.issueToken is not None:
+            handler.issueToken.update({key: value for key, value in token.items() if key != "__typename" and value})
+        self.controller._refresh_token = handler.refreshToken  # noqa: SLF001
+        self.refresh_count += 1
+        self._set_expiry(token)
+        return True
+
+    async def async_ensure_token(self) -> PyXploraApi:
+        """Return a controller with a valid token, logging in only when needed."""
+        async with self._lock:
+            if self.controller is None or self._expires_at is None:
+                await self._async_login()
+            elif self.controller.inter_error is not None:
+                _LOGGER.debug("Xplora® API reported an error, logging in again: %s", self.controller.inter_error)
+                await self._async_login()
+            elif dt_util.utcnow() >= self._expires_at - timedelta(seconds=TOKEN_REFRESH_MARGIN):
+                if not await self._async_refresh():
+                    _LOGGER.debug("Xplora® token could not be refreshed, logging in again")
+                    await self._async_login()
+        return self.controller
+
+    async def async_refresh_user(self, max_age: float) -> None:
+        """Reload the account payload once it is older than max_age seconds, logging in again if the token is rejected."""
+        if self.controller is None or time.monotonic() - self._user_updated < max_age:
+            return
+        self._user_updated = time.monotonic()
+        try:
+            res: dict[str, Any] = await self.controller._gql_handler.getMyInfo_a()  # noqa: SLF001
+        except (Error, aiohttp.ClientError, TimeoutError) as error:
+            _LOGGER.debug("Reading the Xplora® account failed: %s", error)
+            return
+        user: dict[str, Any] | None = (res or {}).get("readMyInfo")
+        if not user:
+            _LOGGER.debug("Xplora® did not return the account, logging in again")
+            await self.async_handle_auth_failure()
+            return
+        children = {child["ward"]["id"]: child for child in user.get("children") or [] if child.get("ward")}
+        self.controller.watchs = [children.get(watch["ward"]["id"], watch) for watch in self.controller.watchs]
+        self.controller.user = user
+
+    async def async_handle_auth_failure(self) -> PyXploraApi:
+        """Drop the current token and log in again."""
+        async with self._lock:
+            await self._async_login()
+        return self.controller
@@ -0,0 +1,100 @@
+"""Track export for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime
+import json
+import math
+from typing import Any
+from xml.sax.saxutils import escape, quoteattr
+
+from .offline_geocoder import METER_PER_DEGREE
+
+Fix = tuple[float, float, float, float, str]
+
+
+def simplify(fixes: Sequence[Fix], tolerance: float) -> list[Fix]:
+    """Drop the fixes closer than tolerance meters to the simplified track (Douglas-Peucker).
+
+    Positions are projected to meters around the first fix, which is exact enough
+    for the length of a day's track.
+    """
+    if tolerance <= 0 or len(fixes) < 3:
+        return list(fixes)
+    cos_lat = math.cos(math.radians(fixes[0][1]))
+    xs = [fix[2] * METER_PER_DEGREE * cos_lat for fix in fixes]
+    ys = [fix[1] * METER_PER_DEGREE for fix in fixes]
+    keep = [False] * len(fixes)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(fixes) - 1)]
+    while stack:
+        first, last = stack.pop()
+        dx = xs[last] - xs[first]
+        dy = ys[last] - ys[first]
+        length = math.hypot(dx, dy)
+        farthest, max_distance = first, 0.0
+        for index in range(first + 1, last):
+            if length:
+                distance = abs(dy * (xs[index] - xs[first]) - dx * (ys[index] - ys[first])) / length
+            else:
+                distance = math.hypot(xs[index] - xs[first], ys[index] - ys[first])
+            if distance > max_distance:
+                farthest, max_distance = index, distance
+        if max_distance > tolerance:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+    return [fix for fix, kept in zip(fixes, keep, strict=True) if kept]
+
+
+def _time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _chunks(items: Sequence[Fix], size: int) -> Iterator[tuple[int, Sequence[Fix]]]:
+    for start in range(0, len(items), size):
+        yield start, items[start : start + size]
+
+
+def geojson_chunks(
+    wuid: str, fixes: Sequence[Fix], chunk_size: int, addresses: Sequence[str | None] | None = None
+) -> Iterator[str]:
+    """Yield a GeoJSON FeatureCollection with one Point feature per fix, chunk_size fixes at a time."""
+    yield f'{{"type":"FeatureCollection","properties":{{"watch_id":{json.dumps(wuid)}}},"features":['
+    separator = ""
+    for start, chunk in _chunks(fixes, chunk_size):
+        parts: list[str] = []
+        for index, (timestamp, lat, lng, accuracy, locate_type) in enumerate(chunk, start):
+            properties: dict[str, Any] = {"time": _time(timestamp), "accuracy": accuracy, "locate_type": locate_type}
+            if addresses is not None:
+                properties["address"] = addresses[index]
+            feature = {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [round(lng, 6), round(lat, 6)]},
+                "properties": properties,
+            }
+            parts.append(separator + json.dumps(feature, separators=(",", ":")))
+            separator = ","
+        yield "".join(parts)
+    yield "]}"
+
+
+def gpx_chunks(
+    wuid: str, fixes: Sequence[Fix], chunk_size: int, addresses: Sequence[str | None] | None = None
+) -> Iterator[str]:
+    """Yield a GPX 1.1 document with one track point per fix, chunk_size fixes at a time."""
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<gpx version="1.1" creator="Xplora Watch" xmlns="http://www.topografix.com/GPX/1/1">'
+        f"<trk><name>{escape(wuid)}</name><trkseg>"
+    )
+    for start, chunk in _chunks(fixes, chunk_size):
+        yield "".join(
+            f"<trkpt lat={quoteattr(f'{lat:.6f}')} lon={quoteattr(f'{lng:.6f}')}>"
+            f"<time>{_time(timestamp)}</time>"
+            f"{f'<desc>{escape(address)}</desc>' if addresses is not None and (address := addresses[index]) else ''}"
+            f"<type>{escape(locate_type)}</type></trkpt>"
+            for index, (timestamp, lat, lng, _, locate_type) in enumerate(chunk, start)
+        )
+    yield "</trkseg></trk></gpx>\n"
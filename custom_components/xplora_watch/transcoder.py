@@ -0,0 +1,200 @@
+"""Voice message transcoding for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+import asyncio
+import binascii
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import StrEnum
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+from pydub import AudioSegment
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DATA_TRANSCODER,
+    DOMAIN,
+    TRANSCODE_JOB_HISTORY,
+    TRANSCODE_LATENCY_SAMPLES,
+    TRANSCODE_TIMEOUT,
+    TRANSCODE_WORKERS,
+)
+from .helper import write_base64_to_file
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TranscodeError(Exception):
+    """The converter failed to transcode a voice message."""
+
+
+class TranscodeStatus(StrEnum):
+    """Status of a transcoding job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class TranscodeJob:
+    """AMR to MP3 conversion of one voice message."""
+
+    msg_id: str
+    status: TranscodeStatus = TranscodeStatus.PENDING
+    submitted: float = field(default_factory=time.monotonic)
+    wait: float | None = None
+    latency: float | None = None
+    error: str | None = None
+
+
+def _remove(*paths: str) -> None:
+    for path in paths:
+        Path(path).unlink(missing_ok=True)
+
+
+class AudioTranscoder:
+    """Convert voice messages from AMR to MP3 in at most ``workers`` converter processes at once.
+
+    Jobs are keyed by message id: a message that is already queued or being
+    converted joins the running job instead of starting a second one. The
+    converter is the ffmpeg (or avconv) binary pydub found, started directly
+    as a subprocess, so neither the event loop nor an executor thread waits on
+    it. The status of the last jobs and the conversion latency are kept for
+    :meth:`stats`.
+    """
+
+    def __init__(self, hass: HomeAssistant, workers: int = TRANSCODE_WORKERS) -> None:
+        """Initialize the transcoder."""
+        self._hass = hass
+        self.workers = max(1, min(workers, os.cpu_count() or 1))
+        self._semaphore = asyncio.Semaphore(self.workers)
+        self._tasks: dict[str, asyncio.Task[bool]] = {}
+        self.jobs: OrderedDict[str, TranscodeJob] = OrderedDict()
+        self.latencies: deque[float] = deque(maxlen=TRANSCODE_LATENCY_SAMPLES)
+        self.done_count = 0
+        self.failed_count = 0
+        self.dedupe_count = 0
+
+    @property
+    def media_path(self) -> str:
+        """Return the directory the MP3 files are served from."""
+        return self._hass.config.path("www/voice")
+
+    def is_pending(self, msg_id: str) -> bool:
+        """Return True while a message is queued or being converted."""
+        return msg_id in self._tasks
+
+    def async_submit(self, msg_id: str, base64_string: str) -> asyncio.Task[bool]:
+        """Queue the conversion of a base64 encoded AMR message, or return the job already running for it."""
+        if (task := self._tasks.get(msg_id)) is not None:
+            self.dedupe_count += 1
+            return task
+        job = TranscodeJob(msg_id)
+        self.jobs[msg_id] = job
+        self.jobs.move_to_end(msg_id)
+        while len(self.jobs) > TRANSCODE_JOB_HISTORY:
+            self.jobs.popitem(last=False)
+
+        task = self._hass.async_create_task(self._async_run(job, base64_string), f"{DOMAIN} transcode {msg_id}")
+        self._tasks[msg_id] = task
+
+        def _done(_: asyncio.Task[bool]) -> None:
+            if self._tasks.get(msg_id) is task:
+                del self._tasks[msg_id]
+
+        task.add_done_callback(_done)
+        return task
+
+    async def async_transcode(self, msg_id: str, base64_string: str) -> bool:
+        """Convert a message and wait for it, True once the MP3 file exists."""
+        return await asyncio.shield(self.async_submit(msg_id, base64_string))
+
+    async def _async_run(self, job: TranscodeJob, base64_string: str) -> bool:
+        mp3_path = f"{self.media_path}/{job.msg_id}.mp3"
+        amr_path = f"{self.media_path}/.{job.msg_id}.amr"
+        temp_path = f"{self.media_path}/.{job.msg_id}.mp3.tmp"
+        if await self._hass.async_add_executor_job(os.path.exists, mp3_path):
+            job.status = TranscodeStatus.DONE
+            return True
+        try:
+            await self._hass.async_add_executor_job(write_base64_to_file, base64_string, amr_path)
+            async with self._semaphore:
+                job.status = TranscodeStatus.RUNNING
+                start = time.monotonic()
+                job.wait = start - job.submitted
+                await self._async_convert(amr_path, temp_path)
+            await self._hass.async_add_executor_job(Path(temp_path).replace, mp3_path)
+        except (OSError, binascii.Error, TimeoutError, TranscodeError) as error:
+            job.status = TranscodeStatus.FAILED
+            job.error = str(error) or type(error).__name__
+            self.failed_count += 1
+            _LOGGER.warning("Could not convert voice message %s: %s", job.msg_id, job.error)
+            return False
+        finally:
+            await self._hass.async_add_executor_job(_remove, amr_path, temp_path)
+
+        job.latency = time.monotonic() - start
+        job.status = TranscodeStatus.DONE
+        self.latencies.append(job.latency)
+        self.done_count += 1
+        _LOGGER.debug("Converted voice message %s in %.2f s after %.2f s in the queue", job.msg_id, job.latency, job.wait)
+        return True
+
+    async def _async_convert(self, source: str, target: str) -> None:
+        """Run the converter on one file, killing it after TRANSCODE_TIMEOUT seconds."""
+        process = await asyncio.create_subprocess_exec(
+            AudioSegment.converter,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "amr",
+            "-i",
+            source,
+            "-f",
+            "mp3",
+            target,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            async with asyncio.timeout(TRANSCODE_TIMEOUT):
+                _, stderr = await process.communicate()
+        except BaseException:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        if process.returncode:
+            raise TranscodeError(stderr.decode(errors="replace").strip()[-200:] or f"exit code {process.returncode}")
+
+    def stats(self) -> dict[str, Any]:
+        """Return the job counts and the conversion latency in seconds."""
+        latencies = sorted(self.latencies)
+        return {
+            "workers": self.workers,
+            "pending": sum(job.status is TranscodeStatus.PENDING for job in self.jobs.values()),
+            "running": sum(job.status is TranscodeStatus.RUNNING for job in self.jobs.values()),
+            "done": self.done_count,
+            "failed": self.failed_count,
+            "deduplicated": self.dedupe_count,
+            "latency_median": round(latencies[len(latencies) // 2], 3) if latencies else None,
+            "latency_p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3) if latencies else None,
+        }
+
+
+def get_transcoder(hass: HomeAssistant) -> AudioTranscoder:
+    """Return the transcoder, shared by all config entries."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if DATA_TRANSCODER not in domain_data:
+        domain_data[DATA_TRANSCODER] = AudioTranscoder(hass)
+    return domain_data[DATA_TRANSCODER]
@@ -0,0 +1,96 @@
+"""HTTP views for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from http import HTTPStatus
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, TRACK_ADDRESS_LIMIT, TRACK_CHUNK_SIZE
+from .coordinator import XploraDataUpdateCoordinator
+from .location_history import LocationHistory
+from .track import geojson_chunks, gpx_chunks, simplify
+
+
+def _parse_time(value: str | None, default: datetime) -> datetime | None:
+    """Parse a query time, naive times are local times of Home Assistant."""
+    if value is None:
+        return default
+    if (parsed := dt_util.parse_datetime(value)) is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.get_default_time_zone())
+    return parsed
+
+
+_FORMATS = {
+    "geojson": ("application/geo+json", geojson_chunks),
+    "gpx": ("application/gpx+xml", gpx_chunks),
+}
+
+
+class XploraTrackView(HomeAssistantView):
+    """Stream the stored track of a watch as GeoJSON or GPX.
+
+    Query parameters are ``format`` (geojson or gpx), ``start`` and ``end`` as
+    ISO 8601 times (default: today), ``tolerance`` in meters for a simplified
+    track and ``addresses`` to add the address of each fix, resolved through the
+    geocode cache and the rate limited map of the config entry.
+    """
+
+    url = f"/api/{DOMAIN}/track/{{wuid}}"
+    name = f"api:{DOMAIN}:track"
+    requires_auth = True
+
+    async def get(self, request: web.Request, wuid: str) -> web.StreamResponse:
+        """Stream the track of a watch."""
+        hass = request.app[KEY_HASS]
+        history: LocationHistory | None = None
+        coordinator: XploraDataUpdateCoordinator | None = None
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+            if coordinator is not None and coordinator.history is not None and wuid in coordinator.history.histories:
+                history = coordinator.history.histories[wuid]
+                break
+        if history is None or coordinator is None:
+            return self.json_message("No location history for this watch", HTTPStatus.NOT_FOUND)
+
+        export_format = request.query.get("format", "geojson")
+        if export_format not in _FORMATS:
+            return self.json_message("format must be geojson or gpx", HTTPStatus.BAD_REQUEST)
+        start = _parse_time(request.query.get("start"), dt_util.start_of_local_day())
+        end = _parse_time(request.query.get("end"), dt_util.now())
+        try:
+            tolerance = float(request.query.get("tolerance", 0))
+        except ValueError:
+            tolerance = -1
+        if start is None or end is None or tolerance < 0:
+            return self.json_message("Invalid start, end or tolerance", HTTPStatus.BAD_REQUEST)
+
+        fixes = history.between(start.timestamp(), end.timestamp())
+        if tolerance and len(fixes) > 2:
+            fixes = await hass.async_add_executor_job(simplify, fixes, tolerance)
+        addresses: list[str | None] | None = None
+        if request.query.get("addresses", "").lower() in ("1", "true"):
+            if len(fixes) > TRACK_ADDRESS_LIMIT:
+                return self.json_message(
+                    f"Addresses are limited to {TRACK_ADDRESS_LIMIT} locations, use a tolerance or a shorter time range",
+                    HTTPStatus.BAD_REQUEST,
+                )
+            results = await coordinator.async_reverse_geocode_many([(lat, lng) for _, lat, lng, _, _ in fixes])
+            addresses = [None if isinstance(result, Exception) else result[0] for result in results]
+
+        content_type, chunks = _FORMATS[export_format]
+        response = web.StreamResponse(
+            headers={"Content-Disposition": f'attachment; filename="{wuid[25:] or wuid}.{export_format}"'}
+        )
+        response.content_type = content_type
+        response.charset = "utf-8"
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for chunk in chunks(wuid, fixes, TRACK_CHUNK_SIZE, addresses):
+            await response.write(chunk.encode())
+        await response.write_eof()
+        return response
@@ -0,0 +1,89 @@
+"""Zone lookup for Xplora® Watch Version 2."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import math
+from typing import Any
+
+from homeassistant.const import ATTR_FRIENDLY_NAME, ATTR_LATITUDE, ATTR_LONGITUDE, ATTR_RADIUS
+from homeassistant.core import State
+
+from .const import ATTR_TRACKER_LAT, ATTR_TRACKER_LNG, ATTR_TRACKER_RAD, SAFE_ZONE_PREFIX, ZONE_CELL_SIZE
+from .offline_geocoder import METER_PER_DEGREE, haversine_meter
+
+
+@dataclass(frozen=True, slots=True)
+class Zone:
+    """A named circle, either a safe zone of a watch or a Home Assistant zone."""
+
+    name: str
+    lat: float
+    lng: float
+    radius: float
+    zone_id: str = ""
+
+
+def safe_zone_to_zone(safe_zone: dict[str, Any]) -> Zone | None:
+    """Convert a safe zone of getWatchSafeZones, None if it has no valid position."""
+    try:
+        return Zone(
+            safe_zone.get("name") or safe_zone.get("groupName") or "",
+            float(safe_zone[ATTR_TRACKER_LAT]),
+            float(safe_zone[ATTR_TRACKER_LNG]),
+            float(safe_zone.get(ATTR_TRACKER_RAD) or 0),
+            f"{SAFE_ZONE_PREFIX}{safe_zone.get('vendorId', '')}",
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def state_to_zone(state: State) -> Zone | None:
+    """Convert the state of a Home Assistant zone, None if it has no valid position."""
+    try:
+        return Zone(
+            state.attributes.get(ATTR_FRIENDLY_NAME) or state.name,
+            float(state.attributes[ATTR_LATITUDE]),
+            float(state.attributes[ATTR_LONGITUDE]),
+            float(state.attributes.get(ATTR_RADIUS) or 0),
+            state.entity_id,
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class ZoneIndex:
+    """Find the zone a position is in through a grid of the zone circles.
+
+    Each zone is stored in every cell its circle touches, so a lookup only
+    checks the zones of one cell. The smallest matching zone wins.
+    """
+
+    def __init__(self, zones: Iterable[Zone], cell_size: float = ZONE_CELL_SIZE) -> None:
+        """Build the index."""
+        self.cell_size = cell_size
+        self._grid: dict[tuple[int, int], list[Zone]] = {}
+        for zone in zones:
+            if zone.name and zone.radius > 0:
+                self._add(zone)
+
+    def _cell(self, lat: float, lng: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_size), math.floor(lng / self.cell_size)
+
+    def _add(self, zone: Zone) -> None:
+        lat_span = zone.radius / METER_PER_DEGREE
+        lng_span = lat_span / max(math.cos(math.radians(min(abs(zone.lat) + lat_span, 89))), 1e-6)
+        min_row, min_col = self._cell(zone.lat - lat_span, zone.lng - lng_span)
+        max_row, max_col = self._cell(zone.lat + lat_span, zone.lng + lng_span)
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                self._grid.setdefault((row, col), []).append(zone)
+
+    def find(self, lat: float, lng: float) -> Zone | None:
+        """Return the smallest zone that contains a position."""
+        best: Zone | None = None
+        for zone in self._grid.get(self._cell(lat, lng), ()):
+            if haversine_meter(lat, lng, zone.lat, zone.lng) <= zone.radius and (best is None or zone.radius < best.radius):
+                best = zone
+        return best
@@ -0,0 +1,89 @@
+"""Compare the chat parser with the ChatsNew roundtrip of pyxplora_api.
+
+Run from the repository root: python scripts/benchmark/chat_parser.py [--messages 100] [--number 5]
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+import timeit
+
+from pyxplora_api.model import ChatsNew
+
+PARSER_FILE = Path(__file__).resolve().parents[2] / "custom_components" / "xplora_watch" / "chat_parser.py"
+
+
+def load_parser():
+    """Load chat_parser.py without importing the Home Assistant integration."""
+    spec = importlib.util.spec_from_file_location("chat_parser", PARSER_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.parse_chats
+
+
+def user(index: int) -> dict:
+    """Build a chat user like the API returns it."""
+    return {
+        "__typename": "User",
+        "id": f"user-{index}",
+        "userId": f"{index:08d}",
+        "name": f"User {index}",
+        "nickname": None,
+        "phoneNumber": f"+49170{index:07d}",
+        "file": {"__typename": "File", "id": f"file-{index}", "name": "avatar.png"},
+        "xcoin": index,
+    }
+
+
+def payload(messages: int) -> dict:
+    """Build a getWatchChatsRaw payload with the given number of messages."""
+    chats = []
+    for index in range(messages):
+        chats.append(
+            {
+                "__typename": "SimpleChat",
+                "id": f"chat-{index}",
+                "msgId": f"{1700000000000 + index}",
+                "readFlag": index % 2,
+                "type": ["TEXT", "VOICE", "IMAGE", "EMOTICON", "LOCATION"][index % 5],
+                "sender": user(index),
+                "receiver": user(index + 1),
+                "data": {
+                    "tm": str(1700000000 + index),
+                    "sender_name": f"User {index}",
+                    "text": f"Message {index}",
+                    "battery": "80",
+                    "lat": "52.52",
+                    "lng": 13.405,
+                    "emoticon_id": "1001",
+                    "emoji_id": "M1001",
+                    "delete_flag": 0,
+                },
+                "create": str(1700000000000 + index),
+            }
+        )
+    return {"list": chats}
+
+
+def main() -> None:
+    """Check both parsers return the same data and print their timings."""
+    messages = int(sys.argv[sys.argv.index("--messages") + 1]) if "--messages" in sys.argv else 100
+    number = int(sys.argv[sys.argv.index("--number") + 1]) if "--number" in sys.argv else 5
+    parse_chats = load_parser()
+    res_chats = payload(messages)
+
+    expected = ChatsNew.from_dict(res_chats).to_dict()
+    if parse_chats(res_chats) != expected:
+        raise SystemExit("chat_parser.parse_chats differs from ChatsNew.from_dict().to_dict()")
+
+    roundtrip = min(timeit.repeat(lambda: ChatsNew.from_dict(res_chats).to_dict(), number=number, repeat=3)) / number
+    parser = min(timeit.repeat(lambda: parse_chats(res_chats), number=number, repeat=3)) / number
+    print(f"{messages} messages")  # noqa: T201
+    print(f"ChatsNew.from_dict().to_dict(): {roundtrip * 1000:8.3f} ms")  # noqa: T201
+    print(f"chat_parser.parse_chats():      {parser * 1000:8.3f} ms ({roundtrip / parser:.1f}x faster)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()